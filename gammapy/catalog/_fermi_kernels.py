@@ -0,0 +1,329 @@
+# Licensed under a 3-clause BSD style license - see LICENSE.rst
+"""Array kernels used to build the Fermi-LAT flux points, lightcurves and
+pulsar phase profiles.
+
+The kernels work on plain arrays without units. With the ``jit`` compilation
+backend (see `gammapy.utils.compilation`) they are compiled with numba,
+otherwise the NumPy implementations are used.
+"""
+
+import functools
+import numpy as np
+from gammapy.utils.compilation import CompilationBackendEnum
+
+__all__ = ["get_fermi_kernels"]
+
+
+def compute_fp_numpy(flux, flux_err_lo, flux_err_hi, e2dnde):
+    """Compute derived flux point columns.
+
+    Parameters
+    ----------
+    flux : `~numpy.ndarray`
+        Flux values.
+    flux_err_lo, flux_err_hi : `~numpy.ndarray`
+        Lower and upper flux errors, in the unit of ``flux``. As in the
+        catalogs, the lower error is negative, or NaN for upper limits.
+    e2dnde : `~numpy.ndarray`
+        Energy flux values.
+
+    Returns
+    -------
+    flux_errn, e2dnde_errn, e2dnde_errp, is_ul, flux_ul, e2dnde_ul : `~numpy.ndarray`
+        Derived columns, upper limits are NaN for regular flux points.
+    """
+    flux_errn = -flux_err_lo
+    # energy flux errors scale with the relative flux errors
+    e2dnde_per_flux = e2dnde / flux
+    e2dnde_errn = -e2dnde_per_flux * flux_err_lo
+    e2dnde_errp = e2dnde_per_flux * flux_err_hi
+
+    # upper limits are only computed for the flux points that need one
+    is_ul = np.isnan(flux_errn)
+    flux_ul = np.full_like(flux_errn, np.nan)
+    flux_ul[is_ul] = compute_ul_numpy(flux[is_ul], flux_err_hi[is_ul])
+    e2dnde_ul = np.full_like(e2dnde_errp, np.nan)
+    e2dnde_ul[is_ul] = compute_ul_numpy(e2dnde[is_ul], e2dnde_errp[is_ul])
+    return flux_errn, e2dnde_errn, e2dnde_errp, is_ul, flux_ul, e2dnde_ul
+
+
+def _compute_fp_loop(flux, flux_err_lo, flux_err_hi, e2dnde):
+    """Single pass version of `compute_fp_numpy`, compiled with numba."""
+    n = flux.shape[0]
+    flux_errn = np.empty_like(flux)
+    e2dnde_errn = np.empty_like(e2dnde)
+    e2dnde_errp = np.empty_like(e2dnde)
+    is_ul = np.empty(n, dtype=np.bool_)
+    flux_ul = np.full_like(flux, np.nan)
+    e2dnde_ul = np.full_like(e2dnde, np.nan)
+
+    for i in range(n):
+        flux_errn[i] = -flux_err_lo[i]
+        e2dnde_per_flux = e2dnde[i] / flux[i]
+        e2dnde_errn[i] = -e2dnde_per_flux * flux_err_lo[i]
+        e2dnde_errp[i] = e2dnde_per_flux * flux_err_hi[i]
+        is_ul[i] = np.isnan(flux_errn[i])
+        if is_ul[i]:
+            flux_ul[i] = 2 * flux_err_hi[i] + flux[i]
+            e2dnde_ul[i] = 2 * e2dnde_errp[i] + e2dnde[i]
+
+    return flux_errn, e2dnde_errn, e2dnde_errp, is_ul, flux_ul, e2dnde_ul
+
+
+def compute_fp_sqrt_ts_numpy(flux, flux_err_lo, flux_err_hi, e2dnde, sqrt_ts):
+    """Compute derived flux point columns, with upper limits below 2 sigma.
+
+    Same as `compute_fp_numpy`, but flux points with a significance
+    ``sqrt_ts`` below 2 are upper limits as well, as in the 3PC.
+
+    Returns
+    -------
+    flux_errn, e2dnde_errn, e2dnde_errp, is_ul, flux_ul, e2dnde_ul : `~numpy.ndarray`
+        Derived columns, upper limits are NaN for regular flux points.
+    """
+    flux_errn, e2dnde_errn, e2dnde_errp, is_ul, flux_ul, e2dnde_ul = compute_fp_numpy(
+        flux, flux_err_lo, flux_err_hi, e2dnde
+    )
+
+    is_low_ts = ~is_ul & (sqrt_ts < 2)
+    flux_ul[is_low_ts] = compute_ul_numpy(flux[is_low_ts], flux_err_hi[is_low_ts])
+    e2dnde_ul[is_low_ts] = compute_ul_numpy(e2dnde[is_low_ts], e2dnde_errp[is_low_ts])
+    return flux_errn, e2dnde_errn, e2dnde_errp, is_ul | is_low_ts, flux_ul, e2dnde_ul
+
+
+def _compute_fp_sqrt_ts_loop(flux, flux_err_lo, flux_err_hi, e2dnde, sqrt_ts):
+    """Single pass version of `compute_fp_sqrt_ts_numpy`, compiled with numba."""
+    n = flux.shape[0]
+    flux_errn = np.empty_like(flux)
+    e2dnde_errn = np.empty_like(e2dnde)
+    e2dnde_errp = np.empty_like(e2dnde)
+    is_ul = np.empty(n, dtype=np.bool_)
+    flux_ul = np.full_like(flux, np.nan)
+    e2dnde_ul = np.full_like(e2dnde, np.nan)
+
+    for i in range(n):
+        flux_errn[i] = -flux_err_lo[i]
+        e2dnde_per_flux = e2dnde[i] / flux[i]
+        e2dnde_errn[i] = -e2dnde_per_flux * flux_err_lo[i]
+        e2dnde_errp[i] = e2dnde_per_flux * flux_err_hi[i]
+        is_ul[i] = np.isnan(flux_errn[i]) or sqrt_ts[i] < 2
+        if is_ul[i]:
+            flux_ul[i] = 2 * flux_err_hi[i] + flux[i]
+            e2dnde_ul[i] = 2 * e2dnde_errp[i] + e2dnde[i]
+
+    return flux_errn, e2dnde_errn, e2dnde_errp, is_ul, flux_ul, e2dnde_ul
+
+
+def compute_lightcurve_numpy(flux, flux_err_lo, flux_err_hi, sqrt_ts):
+    """Compute derived lightcurve columns.
+
+    Parameters
+    ----------
+    flux : `~numpy.ndarray`
+        Flux values.
+    flux_err_lo, flux_err_hi : `~numpy.ndarray`
+        Lower (negative) and upper flux errors, in the unit of ``flux``.
+    sqrt_ts : `~numpy.ndarray`
+        Square root of the test statistic.
+
+    Returns
+    -------
+    flux_errn, flux_ul, ts : `~numpy.ndarray`
+        Derived columns, the upper limit is computed for every time bin.
+    """
+    return -flux_err_lo, 2 * flux_err_hi + flux, sqrt_ts**2
+
+
+def _compute_lightcurve_loop(flux, flux_err_lo, flux_err_hi, sqrt_ts):
+    """Single pass version of `compute_lightcurve_numpy`, compiled with numba."""
+    flux_errn = np.empty_like(flux_err_lo)
+    flux_ul = np.empty_like(flux)
+    ts = np.empty_like(sqrt_ts)
+
+    for i in range(flux.shape[0]):
+        flux_errn[i] = -flux_err_lo[i]
+        flux_ul[i] = 2 * flux_err_hi[i] + flux[i]
+        ts[i] = sqrt_ts[i] * sqrt_ts[i]
+
+    return flux_errn, flux_ul, ts
+
+
+def compute_ul_numpy(flux, flux_errp):
+    """Compute the upper limit from the flux and its positive error.
+
+    See https://arxiv.org/pdf/1501.02003.pdf (page 30).
+
+    Parameters
+    ----------
+    flux, flux_errp : `~numpy.ndarray`
+        Flux values and positive errors, in the same unit.
+
+    Returns
+    -------
+    flux_ul : `~numpy.ndarray`
+        Upper limit values.
+    """
+    return 2 * flux_errp + flux
+
+
+def unique_sorted_numpy(values):
+    """Unique values and the index of their first occurrence.
+
+    Same as ``np.unique(values, return_index=True)``, but linear in the
+    number of values if they are sorted already, as the phases in the
+    pulsar auxiliary files are.
+
+    Parameters
+    ----------
+    values : `~numpy.ndarray`
+        Values.
+
+    Returns
+    -------
+    unique, index : `~numpy.ndarray`
+        Sorted unique values and index of their first occurrence.
+    """
+    if values.size == 0 or np.any(values[1:] < values[:-1]):
+        return np.unique(values, return_index=True)
+
+    is_first = np.empty(values.shape, dtype=bool)
+    is_first[0] = True
+    np.not_equal(values[1:], values[:-1], out=is_first[1:])
+    index = np.flatnonzero(is_first)
+    return values[index], index
+
+
+def _unique_sorted_loop(values):
+    """Single pass version of `unique_sorted_numpy`, compiled with numba."""
+    n = values.shape[0]
+
+    is_sorted = True
+    for i in range(1, n):
+        if values[i] < values[i - 1]:
+            is_sorted = False
+            break
+
+    if is_sorted:
+        order = np.arange(n)
+    else:
+        order = np.argsort(values, kind="mergesort")
+
+    index = np.empty(n, dtype=np.int64)
+    n_unique = 0
+    for i in range(n):
+        if i == 0 or values[order[i]] != values[order[i - 1]]:
+            index[n_unique] = order[i]
+            n_unique += 1
+
+    index = index[:n_unique]
+    return values[index], index
+
+
+def bin_edges_numpy(lower, upper):
+    """Bin edges from the lower and upper bounds of the bins.
+
+    Same as the sorted unique values of both bounds, but without sorting
+    for increasing and contiguous bins, as the phase bins of the pulsar
+    auxiliary files and the energy bands of the catalogs are.
+
+    Parameters
+    ----------
+    lower, upper : `~numpy.ndarray`
+        Lower and upper bounds of the bins.
+
+    Returns
+    -------
+    edges : `~numpy.ndarray`
+        Bin edges.
+    """
+    if np.array_equal(lower[1:], upper[:-1]) and np.all(upper > lower):
+        return np.concatenate([lower[:1], upper])
+
+    return np.unique(np.concatenate((lower, upper)))
+
+
+def _bin_edges_loop(lower, upper):
+    """Single pass version of `bin_edges_numpy`, compiled with numba."""
+    n = lower.shape[0]
+
+    is_contiguous = n > 0
+    for i in range(n):
+        if upper[i] <= lower[i] or (i > 0 and lower[i] != upper[i - 1]):
+            is_contiguous = False
+            break
+
+    if not is_contiguous:
+        return np.unique(np.concatenate((lower, upper)))
+
+    edges = np.empty(n + 1, dtype=upper.dtype)
+    edges[0] = lower[0]
+    edges[1:] = upper
+    return edges
+
+
+def _native(func):
+    """Pass arrays in native byte order, as required by numba."""
+
+    @functools.wraps(func)
+    def wrapper(*args):
+        args = [np.asarray(_, dtype=_.dtype.newbyteorder("=")) for _ in args]
+        return func(*args)
+
+    return wrapper
+
+
+@functools.lru_cache(maxsize=None)
+def _get_fermi_kernels_jit():
+    """Get Fermi kernels compiled with numba."""
+    from numba import njit
+
+    jit = njit(nogil=True, cache=True)
+    return dict(
+        compute_fp=_native(jit(_compute_fp_loop)),
+        compute_fp_sqrt_ts=_native(jit(_compute_fp_sqrt_ts_loop)),
+        compute_lightcurve=_native(jit(_compute_lightcurve_loop)),
+        compute_ul=_native(jit(compute_ul_numpy)),
+        unique_sorted=_native(jit(_unique_sorted_loop)),
+        bin_edges=_native(jit(_bin_edges_loop)),
+    )
+
+
+def _get_fermi_kernels_numpy():
+    """Get Fermi kernels implemented with NumPy."""
+    return dict(
+        compute_fp=compute_fp_numpy,
+        compute_fp_sqrt_ts=compute_fp_sqrt_ts_numpy,
+        compute_lightcurve=compute_lightcurve_numpy,
+        compute_ul=compute_ul_numpy,
+        unique_sorted=unique_sorted_numpy,
+        bin_edges=bin_edges_numpy,
+    )
+
+
+def get_fermi_kernels(backend=None):
+    """Get the Fermi kernels for a compilation backend.
+
+    There are no cython kernels, the NumPy implementation is used instead.
+
+    Parameters
+    ----------
+    backend : {"cython", "jit"}, optional
+        Compilation backend. Default is None, which uses
+        `gammapy.utils.compilation.COMPILATION_BACKEND_DEFAULT`.
+
+    Returns
+    -------
+    kernels : dict
+        Dictionary of kernel functions.
+    """
+    if backend is None:
+        from gammapy.utils.compilation import COMPILATION_BACKEND_DEFAULT
+
+        backend = COMPILATION_BACKEND_DEFAULT
+
+    backend = CompilationBackendEnum.from_str(backend)
+
+    if backend == CompilationBackendEnum.jit:
+        return _get_fermi_kernels_jit()
+
+    return _get_fermi_kernels_numpy()
@@ -34,6 +34,25 @@ def format_flux_points_table(table):
     return table
 
 
+def _column_to_strings(column):
+    """Column values as a list of strings, as given by ``str(row[name])``.
+
+    Masked values are given as ``"--"``.
+    """
+    if column.dtype.kind in "US":
+        values = column.tolist()
+    else:
+        values = [str(_) for _ in column]
+
+    mask = getattr(column, "mask", None)
+
+    if mask is not None:
+        for idx in np.flatnonzero(mask):
+            values[idx] = "--"
+
+    return values
+
+
 class SourceCatalogObject:
     """Source catalog object.
 
@@ -143,12 +162,16 @@ class SourceCatalog(abc.ABC):
     @lazyproperty
     def _name_to_index_cache(self):
         # Make a dict for quick lookup: source name -> row index
+        # The columns are converted to strings once, which is much faster
+        # than accessing them row by row
+        source_names = _column_to_strings(self.table[self._source_name_key])
+        aliases = [_column_to_strings(self.table[_]) for _ in self._source_name_alias]
+
         names = {}
-        for idx, row in enumerate(self.table):
-            name = row[self._source_name_key]
+        for idx, (name, *row_aliases) in enumerate(zip(source_names, *aliases)):
             names[name.strip()] = idx
-            for alias_column in self._source_name_alias:
-                for alias in str(row[alias_column]).split(","):
+            for value in row_aliases:
+                for alias in value.split(","):
                     if not alias == "":
                         names[alias.strip()] = idx
         return names
@@ -249,20 +272,14 @@ class SourceCatalog(abc.ABC):
         hist2_table = getattr(self, "hist2_table", None)
 
         if hist_table:
-            try:
-                data["time_axis"] = TimeMapAxis.from_table(
-                    hist_table, format="fermi-fgl"
-                )
-            except KeyError:
-                pass
+            time_axis = self._time_axis(hist_table)
+            if time_axis is not None:
+                data["time_axis"] = time_axis
 
         if hist2_table:
-            try:
-                data["time_axis_2"] = TimeMapAxis.from_table(
-                    hist2_table, format="fermi-fgl"
-                )
-            except KeyError:
-                pass
+            time_axis = self._time_axis(hist2_table)
+            if time_axis is not None:
+                data["time_axis_2"] = time_axis
         if "Extended_Source_Name" in data:
             name_extended = data["Extended_Source_Name"].strip()
         elif "Source_Name" in data:
@@ -303,10 +320,38 @@ class SourceCatalog(abc.ABC):
         return name_spectral
 
     def _lookup_additional_table(self, selected_table):
-        """"""
-        names = [_.strip() for _ in selected_table]
-        idx = range(len(names))
-        return dict(zip(names, idx))
+        """Make a dict for quick lookup: stripped source name -> row index.
+
+        The dict is cached per column, it is used for every source object.
+        """
+        cache = self.__dict__.setdefault("_lookup_additional_table_cache", {})
+        column, lookup = cache.get(id(selected_table), (None, None))
+
+        if column is not selected_table:
+            names = [_.strip() for _ in selected_table]
+            idx = range(len(names))
+            lookup = dict(zip(names, idx))
+            cache[id(selected_table)] = selected_table, lookup
+
+        return lookup
+
+    def _time_axis(self, hist_table):
+        """Make the lightcurve time axis of a history table.
+
+        The axis is cached per table, it is shared by every source object.
+        Returns None if the table does not define a time axis.
+        """
+        cache = self.__dict__.setdefault("_time_axis_cache", {})
+        table, time_axis = cache.get(id(hist_table), (None, None))
+
+        if table is not hist_table:
+            try:
+                time_axis = TimeMapAxis.from_table(hist_table, format="fermi-fgl")
+            except KeyError:
+                time_axis = None
+            cache[id(hist_table)] = hist_table, time_axis
+
+        return time_axis
 
     @property
     def positions(self):
@@ -1,15 +1,23 @@
 # Licensed under a 3-clause BSD style license - see LICENSE.rst
 """Fermi catalog and source classes."""
-
 import abc
+import functools
+import inspect
 import logging
+import math
+import re
+import sys
 import warnings
+from concurrent.futures import ThreadPoolExecutor
+from copy import deepcopy
 import numpy as np
 import astropy.units as u
+from astropy.io import fits
 from astropy.table import Table
+from astropy.utils import lazyproperty
 from astropy.wcs import FITSFixedWarning
 from gammapy.estimators import FluxPoints
-from gammapy.maps import MapAxis, Maps, RegionGeom, RegionNDMap
+from gammapy.maps import Map, MapAxis, Maps, RegionGeom, RegionNDMap
 from gammapy.modeling.models import (
     DiskSpatialModel,
     GaussianSpatialModel,
@@ -19,9 +27,12 @@ from gammapy.modeling.models import (
     SkyModel,
     TemplateSpatialModel,
 )
+from gammapy.utils import parallel
+from gammapy.utils.compat import COPY_IF_NEEDED
 from gammapy.utils.gauss import Gauss2DPDF
 from gammapy.utils.scripts import make_path
 from gammapy.utils.table import table_standardise_units_inplace
+from ._fermi_kernels import get_fermi_kernels
 from .core import SourceCatalog, SourceCatalogObject, format_flux_points_table
 
 __all__ = [
@@ -41,10 +52,59 @@ __all__ = [
 
 log = logging.getLogger(__name__)
 
+# Templates of the static parts of the source info, formatted with the
+# source data dict, e.g. ``_INFO_POSITION_TEMPLATE.format_map(self.data)``.
+_INFO_POSITION_TEMPLATE = (
+    "\n*** Position info ***\n\n"
+    "RA                   : {RAJ2000:.3f}\n"
+    "DEC                  : {DEJ2000:.3f}\n"
+    "GLON                 : {GLON:.3f}\n"
+    "GLAT                 : {GLAT:.3f}\n"
+    "\n"
+)
+
+_INFO_POSITION_ERRORS_TEMPLATE = (
+    "Semimajor (68%)      : {Conf_68_SemiMajor:.4f}\n"
+    "Semiminor (68%)      : {Conf_68_SemiMinor:.4f}\n"
+    "Position angle (68%) : {Conf_68_PosAng:.2f}\n"
+    "Semimajor (95%)      : {Conf_95_SemiMajor:.4f}\n"
+    "Semiminor (95%)      : {Conf_95_SemiMinor:.4f}\n"
+    "Position angle (95%) : {Conf_95_PosAng:.2f}\n"
+    "ROI number           : {ROI_num:.0f}\n"
+)
+
+_INFO_MORPHOLOGY_TEMPLATE = (
+    "\n*** Extended source information ***\n\n"
+    "Model form       : {Model_Form}\n"
+    "Model semimajor  : {Model_SemiMajor:.4f}\n"
+    "Model semiminor  : {Model_SemiMinor:.4f}\n"
+    "Position angle   : {Model_PosAng:.4f}\n"
+)
+
+_INFO_LIGHTCURVE_TEMPLATE = (
+    "\n*** Lightcurve info ***\n\n"
+    "Lightcurve measured in the energy band: 100 MeV - 100 GeV\n\n"
+    "Variability index : {Variability_Index:.3f}\n"
+)
+
+# TODO: give time as UTC string, not MET
+_INFO_LIGHTCURVE_PEAK_TEMPLATE = (
+    "Significance peak (100 MeV - 100 GeV)    : {Signif_Peak:.3f}\n"
+    "Integral flux peak (100 MeV - 100 GeV)   : "
+    "{Flux_Peak.value:.3} +- {Unc_Flux_Peak.value:.3} cm^-2 s^-1\n"
+    "Time peak                                : "
+    "{Time_Peak.value:.3} s (Mission elapsed time)\n"
+)
+
+
+def _info_flux(label, value, error, unit, width=45):
+    """Format an info line for a flux quantity and its error in a fixed unit."""
+    return f"{label:<{width}s} : {value.value:.3} +- {error.value:.3} {unit}\n"
+
 
 def get_nonentry_keys(d, keys):
-    vals = [str(d[_]).strip() for _ in keys]
-    return ", ".join([_ for _ in vals if _ not in ["", "--"]])
+    vals = (str(d[_]).strip() for _ in keys)
+    return ", ".join(_ for _ in vals if _ not in ("", "--"))
 
 
 def get_nonentry_key(key):
@@ -54,12 +114,357 @@ def get_nonentry_key(key):
         return key
 
 
+def _column_to_list(column):
+    """Column values as a list of Python strings, masked entries as empty strings."""
+    if hasattr(column, "filled"):
+        column = column.filled("")
+    return column.tolist()
+
+
+def _info_basic_columns(table, asso):
+    """Association and class strings of all sources, as a dict of lists.
+
+    The entries are the same as the ones computed per source in
+    ``_info_basic``. Returns None if one of the association columns is missing.
+    """
+    try:
+        asso_lists = [_column_to_list(table[_]) for _ in asso]
+    except KeyError:
+        return None
+
+    columns = {
+        "associations": [
+            ", ".join(_ for _ in map(str.strip, vals) if _ not in ("", "--"))
+            for vals in zip(*asso_lists)
+        ]
+    }
+
+    for name in ["Extended_Source_Name", "CLASS1", "CLASS2", "CLASS"]:
+        if name in table.colnames:
+            columns[name] = [get_nonentry_key(_) for _ in _column_to_list(table[name])]
+
+    return columns
+
+
+def _spec_types(table):
+    """Stripped spectrum types of all sources, None if not available.
+
+    The strings are interned, so that the few distinct spectrum types are
+    shared by all sources and compare by identity in the model dispatch.
+    """
+    try:
+        column = table["SpectrumType"]
+    except KeyError:
+        return None
+
+    return [sys.intern(_.strip()) for _ in _column_to_list(column)]
+
+
+def _eccentricity(table):
+    """Eccentricity of the extended source models."""
+    semi_minor = table["Model_SemiMinor"].quantity
+    semi_major = table["Model_SemiMajor"].quantity
+    return (1 - (semi_minor / semi_major) ** 2.0) ** 0.5
+
+
+def _band_column_names(prefixes, suffixes, postfix=""):
+    """Column names of the per energy band values, as a dict by prefix."""
+    return {
+        prefix: tuple(prefix + _ + postfix for _ in suffixes) for prefix in prefixes
+    }
+
+
+def _band_values(table, names):
+    """Per energy band values of all sources, of shape ``(n_sources, n_bands)``."""
+    columns = table.columns
+    return np.stack([np.asarray(columns[_]) for _ in names], axis=-1)
+
+
 def compute_flux_points_ul(quantity, quantity_errp):
     """Compute UL value for fermi flux points.
 
     See https://arxiv.org/pdf/1501.02003.pdf (page 30).
     """
-    return 2 * quantity_errp + quantity
+    compute_ul = get_fermi_kernels()["compute_ul"]
+
+    if isinstance(quantity, u.Quantity):
+        unit = quantity.unit
+        errp = u.Quantity(quantity_errp, unit, copy=COPY_IF_NEEDED)
+        flux_ul = compute_ul(quantity.value, errp.value)
+        return u.Quantity(flux_ul, unit, copy=COPY_IF_NEEDED)
+
+    return compute_ul(np.asarray(quantity), np.asarray(quantity_errp))
+
+
+def _flux_points_columns(flux, flux_err, e2dnde, sqrt_ts=None):
+    """Derived flux points columns of the 4FGL, 3FGL, 3FHL and 3PC catalogs.
+
+    Works for a single source, with ``flux`` and ``e2dnde`` of shape
+    ``(n_bands,)``, or for the whole catalog with shape ``(n_sources, n_bands)``.
+    ``flux_err`` has an additional last axis of length two for the lower
+    and upper errors. If ``sqrt_ts`` is given, flux points with a significance
+    below 2 are upper limits as well.
+
+    Returns
+    -------
+    columns : dict of `~astropy.units.Quantity` or `~numpy.ndarray`
+        Flux points columns, in table column order.
+    """
+    flux_err = flux_err.to(flux.unit)
+    flux_errp = flux_err[..., 1]
+
+    args = [
+        flux.value.ravel(),
+        flux_err.value[..., 0].ravel(),
+        flux_errp.value.ravel(),
+        e2dnde.value.ravel(),
+    ]
+
+    if sqrt_ts is None:
+        compute_fp = get_fermi_kernels()["compute_fp"]
+    else:
+        compute_fp = get_fermi_kernels()["compute_fp_sqrt_ts"]
+        args.append(np.asarray(sqrt_ts).ravel())
+
+    flux_errn, e2dnde_errn, e2dnde_errp, is_ul, flux_ul, e2dnde_ul = compute_fp(*args)
+
+    shape = flux.shape
+    return {
+        "flux": flux,
+        "flux_errn": flux_errn.reshape(shape) << flux.unit,
+        "flux_errp": flux_errp,
+        "e2dnde": e2dnde,
+        "e2dnde_errn": e2dnde_errn.reshape(shape) << e2dnde.unit,
+        "e2dnde_errp": e2dnde_errp.reshape(shape) << e2dnde.unit,
+        "is_ul": is_ul.reshape(shape),
+        # upper limit columns are float64, as the NaN filled columns they replace
+        "flux_ul": flux_ul.reshape(shape).astype(np.float64) << flux.unit,
+        "e2dnde_ul": e2dnde_ul.reshape(shape).astype(np.float64) << e2dnde.unit,
+    }
+
+
+def _flux_points_columns_table(table):
+    """Derived 4FGL flux points columns of all sources in a catalog table."""
+    return _flux_points_columns(
+        flux=u.Quantity(table["Flux_Band"], "cm-2 s-1", copy=COPY_IF_NEEDED),
+        flux_err=u.Quantity(table["Unc_Flux_Band"], "cm-2 s-1", copy=COPY_IF_NEEDED),
+        e2dnde=u.Quantity(table["nuFnu_Band"], "erg cm-2 s-1", copy=COPY_IF_NEEDED),
+    )
+
+
+@functools.lru_cache(maxsize=256)
+def _read_template_map(filename):
+    """Read a spatial template map, cached by filename."""
+    return Map.read(filename)
+
+
+def _read_spatial_template(filename):
+    """Read a spatial template model.
+
+    Equivalent to `~gammapy.modeling.models.TemplateSpatialModel.read`, but
+    the FITS file is only read once per process, many sources can share
+    the same template. Each call returns a new model.
+    """
+    filename = str(filename)
+    with warnings.catch_warnings():  # ignore FITS units warnings
+        warnings.simplefilter("ignore", FITSFixedWarning)
+        return TemplateSpatialModel(_read_template_map(filename), filename=filename)
+
+
+@functools.lru_cache(maxsize=512)
+def _read_auxiliary_file(filename):
+    """Read a pulsar auxiliary file into memory, cached by filename.
+
+    The compressed file is opened and decompressed only once for all the
+    tables it contains.
+    """
+    with fits.open(filename, memmap=False) as hdulist:
+        return fits.HDUList([hdu.copy() for hdu in hdulist])
+
+
+def _read_auxiliary_table(filename, hdu):
+    """Read a table from the auxiliary file of a pulsar catalog source.
+
+    The file is only read once per process, each call returns a new table.
+    """
+    with warnings.catch_warnings():  # ignore FITS units warnings
+        warnings.simplefilter("ignore", u.UnitsWarning)
+        table = Table.read(_read_auxiliary_file(str(filename)), hdu=hdu)
+
+    return table.copy()
+
+
+def _read_table_meta(hdu):
+    """Table meta of a FITS table HDU, read from its header only."""
+    return Table.read(fits.BinTableHDU(header=hdu.header.copy())).meta
+
+
+def _read_catalog_tables(filename, hdus, optional=(), meta=()):
+    """Read tables from a catalog FITS file, opening it only once.
+
+    FITS units warnings are ignored.
+
+    Parameters
+    ----------
+    filename : str or `~pathlib.Path`
+        Catalog filename.
+    hdus : list of str
+        Names of the table HDUs to read.
+    optional : list of str, optional
+        HDUs that may be missing from the file, None is returned for them.
+    meta : list of str, optional
+        HDUs for which only the table meta is read, from the header.
+
+    Returns
+    -------
+    tables : list
+        Tables, or table meta, in the order of ``hdus``.
+    """
+    tables = []
+
+    with fits.open(make_path(filename), memmap=False) as hdulist:
+        with warnings.catch_warnings():  # ignore FITS units warnings
+            warnings.simplefilter("ignore", u.UnitsWarning)
+            for hdu in hdus:
+                try:
+                    if hdu in meta:
+                        tables.append(_read_table_meta(hdulist[hdu]))
+                    else:
+                        tables.append(Table.read(hdulist, hdu=hdu))
+                except KeyError:
+                    if hdu not in optional:
+                        raise
+                    tables.append(None)
+
+    return tables
+
+
+def _pulsar_models(catalog, n_jobs=None):
+    """Sky models of the pulsar catalog sources that have one.
+
+    With more than one job, the sky models are created in a thread pool.
+    """
+    if n_jobs is None:
+        n_jobs = parallel.N_JOBS_DEFAULT
+
+    if n_jobs > 1:
+        with ThreadPoolExecutor(max_workers=n_jobs) as executor:
+            sky_models = list(executor.map(lambda _: _.sky_model(), catalog))
+    else:
+        sky_models = [_.sky_model() for _ in catalog]
+
+    return Models([_ for _ in sky_models if _ is not None])
+
+
+def _template_path_4fgl(filename, version):
+    """Path of a 4FGL extended source template, for a given catalog version."""
+    filename = filename.strip() + ".gz"
+    if version < 28:
+        path_extended = (
+            "$GAMMAPY_DATA/catalogs/fermi/LAT_extended_sources_8years/Templates/"
+        )
+    elif version < 32:
+        path_extended = "$GAMMAPY_DATA/catalogs/fermi/Extended_12years/Templates/"
+    else:
+        path_extended = "$GAMMAPY_DATA/catalogs/fermi/Extended_14years/Templates/"
+    return make_path(path_extended) / filename
+
+
+def _spatial_model_disk(ra, dec, de, e):
+    return DiskSpatialModel(
+        lon_0=ra,
+        lat_0=dec,
+        r_0=de["Model_SemiMajor"],
+        e=e,
+        phi=de["Model_PosAng"],
+        frame="icrs",
+    )
+
+
+def _spatial_model_gauss(ra, dec, de, e):
+    return GaussianSpatialModel(
+        lon_0=ra,
+        lat_0=dec,
+        sigma=de["Model_SemiMajor"],
+        e=e,
+        phi=de["Model_PosAng"],
+        frame="icrs",
+    )
+
+
+def _spatial_model_template_4fgl(ra, dec, de, e):
+    path = _template_path_4fgl(de["Spatial_Filename"], de["version"])
+    return _read_spatial_template(path)
+
+
+def _spatial_model_template_archive(version, ra, dec, de, e):
+    """Template model from a version of the Fermi-LAT extended sources archive."""
+    path = make_path(
+        f"$GAMMAPY_DATA/catalogs/fermi/Extended_archive_{version}/Templates/"
+    )
+    return _read_spatial_template(path / de["Spatial_Filename"].strip())
+
+
+_spatial_model_template_v15 = functools.partial(_spatial_model_template_archive, "v15")
+_spatial_model_template_v18 = functools.partial(_spatial_model_template_archive, "v18")
+
+
+@functools.lru_cache(maxsize=None)
+def _containment_radius_gauss2d(fraction):
+    """Containment radius of the unit `~gammapy.utils.gauss.Gauss2DPDF`.
+
+    Only called with the 68% and 95% containment fractions of the
+    catalogs, so the values are cached instead of being recomputed
+    for every source.
+    """
+    return Gauss2DPDF().containment_radius(fraction)
+
+
+def _cached_model(method):
+    """Cache the model built by a source object method.
+
+    The model is built once per source object and call arguments, every
+    call returns a copy of it, so callers can safely modify the result.
+    Arguments passed by position, by keyword or left to their default
+    share the same cached model.
+    """
+    signature = inspect.signature(method)
+
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        cache = self.__dict__.setdefault("_model_cache", {})
+        arguments = signature.bind(self, *args, **kwargs)
+        arguments.apply_defaults()
+        key = (method.__name__, tuple(arguments.arguments.items())[1:])
+
+        if key not in cache:
+            cache[key] = method(self, *args, **kwargs)
+
+        model = cache[key]
+        return None if model is None else deepcopy(model)
+
+    return wrapper
+
+
+def _cached_table(method):
+    """Cache the table built by a source object property.
+
+    The table is built once per source object, every access returns a
+    copy of it, so callers can safely modify the result.
+    """
+
+    @functools.wraps(method)
+    def wrapper(self):
+        cache = self.__dict__.setdefault("_table_cache", {})
+        name = method.__name__
+
+        if name not in cache:
+            cache[name] = method(self)
+
+        table = cache[name]
+        return None if table is None else table.copy()
+
+    return wrapper
 
 
 class SourceCatalogObjectFermiPCBase(SourceCatalogObject, abc.ABC):
@@ -72,28 +477,29 @@ class SourceCatalogObjectFermiPCBase(SourceCatalogObject, abc.ABC):
         if info == "all":
             info = "basic,more,position,pulsar,spectral,lightcurve"
 
-        ss = ""
+        ss = []
         ops = info.split(",")
         if "basic" in ops:
-            ss += self._info_basic()
+            ss.append(self._info_basic())
         if "more" in ops:
-            ss += self._info_more()
+            ss.append(self._info_more())
         if "pulsar" in ops:
-            ss += self._info_pulsar()
+            ss.append(self._info_pulsar())
         if "position" in ops:
-            ss += self._info_position()
+            ss.append(self._info_position())
         if "spectral" in ops:
-            ss += self._info_spectral_fit()
-            ss += self._info_spectral_points()
+            ss.append(self._info_spectral_fit())
+            ss.append(self._info_spectral_points())
         if "lightcurve" in ops:
-            ss += self._info_phasogram()
-        return ss
+            ss.append(self._info_phasogram())
+        return "".join(ss)
 
     def _info_basic(self):
-        ss = "\n*** Basic info ***\n\n"
-        ss += "Catalog row index (zero-based) : {}\n".format(self.row_index)
-        ss += "{:<20s} : {}\n".format("Source name", self.name)
-        return ss
+        return (
+            "\n*** Basic info ***\n\n"
+            f"Catalog row index (zero-based) : {self.row_index}\n"
+            f"{'Source name':<20s} : {self.name}\n"
+        )
 
     def _info_more(self):
         return ""
@@ -103,31 +509,32 @@ class SourceCatalogObjectFermiPCBase(SourceCatalogObject, abc.ABC):
 
     def _info_position(self):
         source_pos = self.position
-        ss = "\n*** Position info ***\n\n"
-        ss += "{:<20s} : {:.3f}\n".format("RA", source_pos.ra)
-        ss += "{:<20s} : {:.3f}\n".format("DEC", source_pos.dec)
-        ss += "{:<20s} : {:.3f}\n".format("GLON", source_pos.galactic.l)
-        ss += "{:<20s} : {:.3f}\n".format("GLAT", source_pos.galactic.b)
-        return ss
+        galactic = source_pos.galactic
+        return (
+            "\n*** Position info ***\n\n"
+            f"{'RA':<20s} : {source_pos.ra:.3f}\n"
+            f"{'DEC':<20s} : {source_pos.dec:.3f}\n"
+            f"{'GLON':<20s} : {galactic.l:.3f}\n"
+            f"{'GLAT':<20s} : {galactic.b:.3f}\n"
+        )
 
     def _info_spectral_fit(self):
         return "\n"
 
     def _info_spectral_points(self):
         ss = "\n*** Spectral points ***\n\n"
-        if self.flux_points_table is None:
-            ss += "No spectral points available.\n"
-            return ss
-        lines = format_flux_points_table(self.flux_points_table).pformat(
+        flux_points_table = self.flux_points_table
+        if flux_points_table is None:
+            return ss + "No spectral points available.\n"
+        lines = format_flux_points_table(flux_points_table).pformat(
             max_width=-1, max_lines=-1
         )
-        ss += "\n".join(lines)
-        ss += "\n"
-        return ss
+        return "".join([ss, "\n".join(lines), "\n"])
 
     def _info_phasogram(self):
         return ""
 
+    @_cached_model
     def spatial_model(self):
         source_pos = self.position
         ra = source_pos.ra
@@ -151,15 +558,25 @@ class SourceCatalogObjectFermiPCBase(SourceCatalogObject, abc.ABC):
             name=name,
         )
 
+    @_cached_model
+    def _reference_model(self):
+        """Reference model for the flux points, without spatial model."""
+        spectral_model = self.spectral_model()
+        if spectral_model is None:
+            return None
+
+        return SkyModel(spectral_model=spectral_model, name=self.name)
+
     @property
     def flux_points(self):
         """Flux points (`~gammapy.estimators.FluxPoints`)."""
-        if self.flux_points_table is None:
+        table = self.flux_points_table
+        if table is None:
             return None
 
         return FluxPoints.from_table(
-            table=self.flux_points_table,
-            reference_model=self.sky_model(),
+            table=table,
+            reference_model=self._reference_model(),
             format="gadf-sed",
         )
 
@@ -194,52 +611,68 @@ class SourceCatalogObjectFermiBase(SourceCatalogObject, abc.ABC):
         if info == "all":
             info = "basic,more,position,spectral,lightcurve"
 
-        ss = ""
+        ss = []
         ops = info.split(",")
         if "basic" in ops:
-            ss += self._info_basic()
+            ss.append(self._info_basic())
         if "more" in ops:
-            ss += self._info_more()
+            ss.append(self._info_more())
         if "position" in ops:
-            ss += self._info_position()
+            ss.append(self._info_position())
             if not self.is_pointlike:
-                ss += self._info_morphology()
+                ss.append(self._info_morphology())
         if "spectral" in ops:
-            ss += self._info_spectral_fit()
-            ss += self._info_spectral_points()
+            ss.append(self._info_spectral_fit())
+            ss.append(self._info_spectral_points())
         if "lightcurve" in ops:
-            ss += self._info_lightcurve()
-        return ss
+            ss.append(self._info_lightcurve())
+        return "".join(ss)
+
+    def _info_basic_values(self):
+        """Association and class strings, precomputed by the catalog if available."""
+        d = self.data
+        values = d.get("info_basic")
+
+        if values is None:
+            values = {
+                name: get_nonentry_key(d[name])
+                for name in ["Extended_Source_Name", "CLASS1", "CLASS2", "CLASS"]
+                if name in d
+            }
+            values["associations"] = get_nonentry_keys(d, self.asso)
+
+        return values
 
     def _info_basic(self):
         d = self.data
-        keys = self.asso
-        ss = "\n*** Basic info ***\n\n"
-        ss += "Catalog row index (zero-based) : {}\n".format(self.row_index)
-        ss += "{:<20s} : {}\n".format("Source name", self.name)
-
-        if "Extended_Source_Name" in d:
-            ss += "{:<20s} : {}\n".format(
-                "Extended name", get_nonentry_key(d["Extended_Source_Name"])
+        values = self._info_basic_values()
+        ss = ["\n*** Basic info ***\n\n"]
+        ss.append("Catalog row index (zero-based) : {}\n".format(self.row_index))
+        ss.append("{:<20s} : {}\n".format("Source name", self.name))
+
+        if "Extended_Source_Name" in values:
+            ss.append(
+                "{:<20s} : {}\n".format("Extended name", values["Extended_Source_Name"])
             )
 
-        associations = get_nonentry_keys(d, keys)
-        ss += "{:<16s} : {}\n".format("Associations", associations)
+        ss.append("{:<16s} : {}\n".format("Associations", values["associations"]))
         try:
-            ss += "{:<16s} : {:.3f}\n".format("ASSOC_PROB_BAY", d["ASSOC_PROB_BAY"])
-            ss += "{:<16s} : {:.3f}\n".format("ASSOC_PROB_LR", d["ASSOC_PROB_LR"])
+            ss.append(
+                "{:<16s} : {:.3f}\n".format("ASSOC_PROB_BAY", d["ASSOC_PROB_BAY"])
+            )
+            ss.append("{:<16s} : {:.3f}\n".format("ASSOC_PROB_LR", d["ASSOC_PROB_LR"]))
         except KeyError:
             pass
         try:
-            ss += "{:<16s} : {}\n".format("Class1", get_nonentry_key(d["CLASS1"]))
+            ss.append("{:<16s} : {}\n".format("Class1", values["CLASS1"]))
         except KeyError:
-            ss += "{:<16s} : {}\n".format("Class", get_nonentry_key(d["CLASS"]))
+            ss.append("{:<16s} : {}\n".format("Class", values["CLASS"]))
         try:
-            ss += "{:<16s} : {}\n".format("Class2", get_nonentry_key(d["CLASS2"]))
+            ss.append("{:<16s} : {}\n".format("Class2", values["CLASS2"]))
         except KeyError:
             pass
-        ss += "{:<16s} : {}\n".format("TeVCat flag", d.get("TEVCAT_FLAG", "N/A"))
-        return ss
+        ss.append("{:<16s} : {}\n".format("TeVCat flag", d.get("TEVCAT_FLAG", "N/A")))
+        return "".join(ss)
 
     @abc.abstractmethod
     def _info_more(self):
@@ -247,54 +680,62 @@ class SourceCatalogObjectFermiBase(SourceCatalogObject, abc.ABC):
 
     def _info_position(self):
         d = self.data
-        ss = "\n*** Position info ***\n\n"
-        ss += "{:<20s} : {:.3f}\n".format("RA", d["RAJ2000"])
-        ss += "{:<20s} : {:.3f}\n".format("DEC", d["DEJ2000"])
-        ss += "{:<20s} : {:.3f}\n".format("GLON", d["GLON"])
-        ss += "{:<20s} : {:.3f}\n".format("GLAT", d["GLAT"])
-
-        ss += "\n"
-        ss += "{:<20s} : {:.4f}\n".format("Semimajor (68%)", d["Conf_68_SemiMajor"])
-        ss += "{:<20s} : {:.4f}\n".format("Semiminor (68%)", d["Conf_68_SemiMinor"])
-        ss += "{:<20s} : {:.2f}\n".format("Position angle (68%)", d["Conf_68_PosAng"])
-        ss += "{:<20s} : {:.4f}\n".format("Semimajor (95%)", d["Conf_95_SemiMajor"])
-        ss += "{:<20s} : {:.4f}\n".format("Semiminor (95%)", d["Conf_95_SemiMinor"])
-        ss += "{:<20s} : {:.2f}\n".format("Position angle (95%)", d["Conf_95_PosAng"])
-        ss += "{:<20s} : {:.0f}\n".format("ROI number", d["ROI_num"])
-        return ss
+        ss = _INFO_POSITION_TEMPLATE + _INFO_POSITION_ERRORS_TEMPLATE
+        return ss.format_map(d)
 
     def _info_morphology(self):
         e = self.data_extended
-        ss = "\n*** Extended source information ***\n\n"
-        ss += "{:<16s} : {}\n".format("Model form", e["Model_Form"])
-        ss += "{:<16s} : {:.4f}\n".format("Model semimajor", e["Model_SemiMajor"])
-        ss += "{:<16s} : {:.4f}\n".format("Model semiminor", e["Model_SemiMinor"])
-        ss += "{:<16s} : {:.4f}\n".format("Position angle", e["Model_PosAng"])
+        ss = [_INFO_MORPHOLOGY_TEMPLATE.format_map(e)]
         try:
-            ss += "{:<16s} : {}\n".format("Spatial function", e["Spatial_Function"])
+            ss.append(
+                "{:<16s} : {}\n".format("Spatial function", e["Spatial_Function"])
+            )
         except KeyError:
             pass
-        ss += "{:<16s} : {}\n\n".format(
-            "Spatial filename", get_nonentry_key(e["Spatial_Filename"])
+        ss.append(
+            "{:<16s} : {}\n\n".format(
+                "Spatial filename", get_nonentry_key(e["Spatial_Filename"])
+            )
         )
-        return ss
+        return "".join(ss)
 
     def _info_spectral_fit(self):
         return "\n"
 
     def _info_spectral_points(self):
-        ss = "\n*** Spectral points ***\n\n"
+        ss = ["\n*** Spectral points ***\n\n"]
         lines = format_flux_points_table(self.flux_points_table).pformat(
             max_width=-1, max_lines=-1
         )
-        ss += "\n".join(lines)
-        return ss
+        ss.append("\n".join(lines))
+        return "".join(ss)
 
     def _info_lightcurve(self):
         return "\n"
 
+    @property
+    def _spec_type(self):
+        """Spectrum type, precomputed by the catalog if available."""
+        spec_type = self.data.get("spec_type")
+        if spec_type is None:
+            spec_type = self.data["SpectrumType"].strip()
+        return spec_type
+
+    @property
+    def _eccentricity(self):
+        """Extended model eccentricity, precomputed by the catalog if available."""
+        de = self.data_extended
+        e = de.get("eccentricity")
+        if e is None:
+            e = (1 - (de["Model_SemiMinor"] / de["Model_SemiMajor"]) ** 2.0) ** 0.5
+        return e
+
     @property
     def is_pointlike(self):
+        is_pointlike = self.data.get("is_pointlike")
+        if is_pointlike is not None:
+            return is_pointlike
+
         name = self.data["Extended_Source_Name"].strip()
         return name == "" or name.strip() == "--"
 
@@ -315,12 +756,13 @@ class SourceCatalogObjectFermiBase(SourceCatalogObject, abc.ABC):
             semi_major = d["Conf_95_SemiMajor"]
             phi_0 = d["Conf_95_PosAng"]
 
-        if np.isnan(phi_0):
+        # plain float check, np.isnan would go through the Quantity ufunc machinery
+        if math.isnan(getattr(phi_0, "value", phi_0)):
             phi_0 = 0.0 * u.deg
 
-        scale_1sigma = Gauss2DPDF().containment_radius(percent)
+        scale_1sigma = _containment_radius_gauss2d(percent)
         lat_err = semi_major / scale_1sigma
-        lon_err = semi_minor / scale_1sigma / np.cos(d["DEJ2000"])
+        lon_err = semi_minor / scale_1sigma / np.cos(d["DEJ2000"].to_value("rad"))
 
         if "TemplateSpatialModel" not in model.tag:
             model.parameters["lon_0"].error = lon_err
@@ -338,16 +780,98 @@ class SourceCatalogObjectFermiBase(SourceCatalogObject, abc.ABC):
             name=name,
         )
 
+    @_cached_model
+    def _reference_model(self):
+        """Reference model for the flux points, without spatial model."""
+        return SkyModel(spectral_model=self.spectral_model(), name=self.name)
+
     @property
     def flux_points(self):
         """Flux points as a `~gammapy.estimators.FluxPoints` object."""
         return FluxPoints.from_table(
             table=self.flux_points_table,
-            reference_model=self.sky_model(),
+            reference_model=self._reference_model(),
             format="gadf-sed",
         )
 
 
+def _spectral_model_pars_pl_4fgl(d):
+    tag = "PowerLawSpectralModel"
+    pars = {
+        "reference": d["Pivot_Energy"],
+        "amplitude": d["PL_Flux_Density"],
+        "index": d["PL_Index"],
+    }
+    errs = {
+        "amplitude": d["Unc_PL_Flux_Density"],
+        "index": d["Unc_PL_Index"],
+    }
+    return tag, pars, errs
+
+
+def _spectral_model_pars_lp_4fgl(d):
+    tag = "LogParabolaSpectralModel"
+    pars = {
+        "reference": d["Pivot_Energy"],
+        "amplitude": d["LP_Flux_Density"],
+        "alpha": d["LP_Index"],
+        "beta": d["LP_beta"],
+    }
+    errs = {
+        "amplitude": d["Unc_LP_Flux_Density"],
+        "alpha": d["Unc_LP_Index"],
+        "beta": d["Unc_LP_beta"],
+    }
+    return tag, pars, errs
+
+
+def _spectral_model_pars_plsec_4fgl(d):
+    if "PLEC_ExpfactorS" in d:
+        tag = "SuperExpCutoffPowerLaw4FGLDR3SpectralModel"
+        expfactor = d["PLEC_ExpfactorS"]
+        expfactor_err = d["Unc_PLEC_ExpfactorS"]
+        index_1 = d["PLEC_IndexS"]
+        index_1_err = d["Unc_PLEC_IndexS"]
+    else:
+        tag = "SuperExpCutoffPowerLaw4FGLSpectralModel"
+        expfactor = d["PLEC_Expfactor"]
+        expfactor_err = d["Unc_PLEC_Expfactor"]
+        index_1 = d["PLEC_Index"]
+        index_1_err = d["Unc_PLEC_Index"]
+
+    pars = {
+        "reference": d["Pivot_Energy"],
+        "amplitude": d["PLEC_Flux_Density"],
+        "index_1": index_1,
+        "index_2": d["PLEC_Exp_Index"],
+        "expfactor": expfactor,
+    }
+    errs = {
+        "amplitude": d["Unc_PLEC_Flux_Density"],
+        "index_1": index_1_err,
+        "index_2": np.nan_to_num(float(d["Unc_PLEC_Exp_Index"])),
+        "expfactor": expfactor_err,
+    }
+    return tag, pars, errs
+
+
+# spectral model parameters and errors by "SpectrumType"
+_SPECTRAL_MODEL_PARS_4FGL = {
+    "PowerLaw": _spectral_model_pars_pl_4fgl,
+    "LogParabola": _spectral_model_pars_lp_4fgl,
+    "PLSuperExpCutoff": _spectral_model_pars_plsec_4fgl,
+}
+
+# spatial models by "Model_Form"
+_SPATIAL_MODELS_4FGL = {
+    "Disk": _spatial_model_disk,
+    "Map": _spatial_model_template_4fgl,
+    "Ring": _spatial_model_template_4fgl,
+    "2D Gaussian x2": _spatial_model_template_4fgl,
+    "2D Gaussian": _spatial_model_gauss,
+}
+
+
 class SourceCatalogObject4FGL(SourceCatalogObjectFermiBase):
     """One source from the Fermi-LAT 4FGL catalog.
 
@@ -367,127 +891,135 @@ class SourceCatalogObject4FGL(SourceCatalogObjectFermiBase):
 
     def _info_more(self):
         d = self.data
-        ss = "\n*** Other info ***\n\n"
-        fmt = "{:<32s} : {:.3f}\n"
-        ss += fmt.format("Significance (100 MeV - 1 TeV)", d["Signif_Avg"])
-        ss += "{:<32s} : {:.1f}\n".format("Npred", d["Npred"])
-        ss += "\n{:<20s} : {}\n".format("Other flags", d["Flags"])
-        return ss
+        ss = (
+            "\n*** Other info ***\n\n"
+            "Significance (100 MeV - 1 TeV)   : {Signif_Avg:.3f}\n"
+            "Npred                            : {Npred:.1f}\n"
+            "\nOther flags          : {Flags}\n"
+        )
+        return ss.format_map(d)
 
     def _info_spectral_fit(self):
         d = self.data
-        spec_type = d["SpectrumType"].strip()
+        spec_type = self._spec_type
 
-        ss = "\n*** Spectral info ***\n\n"
+        ss = ["\n*** Spectral info ***\n\n"]
 
-        ss += "{:<45s} : {}\n".format("Spectrum type", d["SpectrumType"])
+        ss.append("{:<45s} : {}\n".format("Spectrum type", d["SpectrumType"]))
         fmt = "{:<45s} : {:.3f}\n"
-        ss += fmt.format("Detection significance (100 MeV - 1 TeV)", d["Signif_Avg"])
+        ss.append(
+            fmt.format("Detection significance (100 MeV - 1 TeV)", d["Signif_Avg"])
+        )
 
         if spec_type == "PowerLaw":
             tag = "PL"
         elif spec_type == "LogParabola":
             tag = "LP"
-            ss += "{:<45s} : {:.4f} +- {:.5f}\n".format(
-                "beta", d["LP_beta"], d["Unc_LP_beta"]
+            ss.append(
+                "{:<45s} : {:.4f} +- {:.5f}\n".format(
+                    "beta", d["LP_beta"], d["Unc_LP_beta"]
+                )
+            )
+            ss.append(
+                "{:<45s} : {:.1f}\n".format("Significance curvature", d["LP_SigCurv"])
             )
-            ss += "{:<45s} : {:.1f}\n".format("Significance curvature", d["LP_SigCurv"])
 
         elif spec_type == "PLSuperExpCutoff":
             tag = "PLEC"
             fmt = "{:<45s} : {:.4f} +- {:.4f}\n"
             if "PLEC_ExpfactorS" in d:
-                ss += fmt.format(
-                    "Exponential factor", d["PLEC_ExpfactorS"], d["Unc_PLEC_ExpfactorS"]
+                ss.append(
+                    fmt.format(
+                        "Exponential factor",
+                        d["PLEC_ExpfactorS"],
+                        d["Unc_PLEC_ExpfactorS"],
+                    )
                 )
             else:
-                ss += fmt.format(
-                    "Exponential factor", d["PLEC_Expfactor"], d["Unc_PLEC_Expfactor"]
+                ss.append(
+                    fmt.format(
+                        "Exponential factor",
+                        d["PLEC_Expfactor"],
+                        d["Unc_PLEC_Expfactor"],
+                    )
+                )
+            ss.append(
+                "{:<45s} : {:.4f} +- {:.4f}\n".format(
+                    "Super-exponential cutoff index",
+                    d["PLEC_Exp_Index"],
+                    d["Unc_PLEC_Exp_Index"],
                 )
-            ss += "{:<45s} : {:.4f} +- {:.4f}\n".format(
-                "Super-exponential cutoff index",
-                d["PLEC_Exp_Index"],
-                d["Unc_PLEC_Exp_Index"],
             )
-            ss += "{:<45s} : {:.1f}\n".format(
-                "Significance curvature", d["PLEC_SigCurv"]
+            ss.append(
+                "{:<45s} : {:.1f}\n".format("Significance curvature", d["PLEC_SigCurv"])
             )
 
         else:
             raise ValueError(f"Invalid spec_type: {spec_type!r}")
 
-        ss += "{:<45s} : {:.0f} {}\n".format(
-            "Pivot energy", d["Pivot_Energy"].value, d["Pivot_Energy"].unit
+        ss.append(
+            "{:<45s} : {:.0f} {}\n".format(
+                "Pivot energy", d["Pivot_Energy"].value, d["Pivot_Energy"].unit
+            )
         )
 
         fmt = "{:<45s} : {:.3f} +- {:.3f}\n"
         if f"{tag}_ExpfactorS" in d:
-            ss += fmt.format(
-                "Spectral index", d[tag + "_IndexS"], d["Unc_" + tag + "_IndexS"]
+            ss.append(
+                fmt.format(
+                    "Spectral index", d[tag + "_IndexS"], d["Unc_" + tag + "_IndexS"]
+                )
             )
         else:
-            ss += fmt.format(
-                "Spectral index", d[tag + "_Index"], d["Unc_" + tag + "_Index"]
+            ss.append(
+                fmt.format(
+                    "Spectral index", d[tag + "_Index"], d["Unc_" + tag + "_Index"]
+                )
             )
 
-        fmt = "{:<45s} : {:.3} +- {:.3} {}\n"
-        ss += fmt.format(
-            "Flux Density at pivot energy",
-            d[tag + "_Flux_Density"].value,
-            d["Unc_" + tag + "_Flux_Density"].value,
-            "cm-2 MeV-1 s-1",
+        ss.append(
+            _info_flux(
+                "Flux Density at pivot energy",
+                d[tag + "_Flux_Density"],
+                d["Unc_" + tag + "_Flux_Density"],
+                "cm-2 MeV-1 s-1",
+            )
         )
-
-        fmt = "{:<45s} : {:.3} +- {:.3} {}\n"
-        ss += fmt.format(
-            "Integral flux (1 - 100 GeV)",
-            d["Flux1000"].value,
-            d["Unc_Flux1000"].value,
-            "cm-2 s-1",
+        ss.append(
+            _info_flux(
+                "Integral flux (1 - 100 GeV)",
+                d["Flux1000"],
+                d["Unc_Flux1000"],
+                "cm-2 s-1",
+            )
         )
-
-        fmt = "{:<45s} : {:.3} +- {:.3} {}\n"
-        ss += fmt.format(
-            "Energy flux (100 MeV - 100 GeV)",
-            d["Energy_Flux100"].value,
-            d["Unc_Energy_Flux100"].value,
-            "erg cm-2 s-1",
+        ss.append(
+            _info_flux(
+                "Energy flux (100 MeV - 100 GeV)",
+                d["Energy_Flux100"],
+                d["Unc_Energy_Flux100"],
+                "erg cm-2 s-1",
+            )
         )
 
-        return ss
+        return "".join(ss)
 
     def _info_lightcurve(self):
         d = self.data
-        ss = "\n*** Lightcurve info ***\n\n"
-        ss += "Lightcurve measured in the energy band: 100 MeV - 100 GeV\n\n"
-
-        ss += "{:<15s} : {:.3f}\n".format("Variability index", d["Variability_Index"])
+        ss = [_INFO_LIGHTCURVE_TEMPLATE.format_map(d)]
 
         if np.isfinite(d["Flux_Peak"]):
-            ss += "{:<40s} : {:.3f}\n".format(
-                "Significance peak (100 MeV - 100 GeV)", d["Signif_Peak"]
-            )
-
-            fmt = "{:<40s} : {:.3} +- {:.3} cm^-2 s^-1\n"
-            ss += fmt.format(
-                "Integral flux peak (100 MeV - 100 GeV)",
-                d["Flux_Peak"].value,
-                d["Unc_Flux_Peak"].value,
-            )
-
-            # TODO: give time as UTC string, not MET
-            ss += "{:<40s} : {:.3} s (Mission elapsed time)\n".format(
-                "Time peak", d["Time_Peak"].value
-            )
+            ss.append(_INFO_LIGHTCURVE_PEAK_TEMPLATE.format_map(d))
             peak_interval = d["Peak_Interval"].to_value("day")
-            ss += "{:<40s} : {:.3} day\n".format("Peak interval", peak_interval)
+            ss.append("{:<40s} : {:.3} day\n".format("Peak interval", peak_interval))
         else:
-            ss += "\nNo peak measured for this source.\n"
+            ss.append("\nNo peak measured for this source.\n")
 
         # TODO: Add a lightcurve table with d['Flux_History'] and d['Unc_Flux_History']
 
-        return ss
+        return "".join(ss)
 
+    @_cached_model
     def spatial_model(self):
         """Spatial model as a `~gammapy.modeling.models.SpatialModel` object."""
         d = self.data
@@ -499,97 +1031,28 @@ class SourceCatalogObject4FGL(SourceCatalogObjectFermiBase):
         else:
             de = self.data_extended
             morph_type = de["Model_Form"].strip()
-            e = (1 - (de["Model_SemiMinor"] / de["Model_SemiMajor"]) ** 2.0) ** 0.5
-            sigma = de["Model_SemiMajor"]
-            phi = de["Model_PosAng"]
-            if morph_type == "Disk":
-                r_0 = de["Model_SemiMajor"]
-                model = DiskSpatialModel(
-                    lon_0=ra, lat_0=dec, r_0=r_0, e=e, phi=phi, frame="icrs"
-                )
-            elif morph_type in ["Map", "Ring", "2D Gaussian x2"]:
-                filename = de["Spatial_Filename"].strip() + ".gz"
-                if de["version"] < 28:
-                    path_extended = "$GAMMAPY_DATA/catalogs/fermi/LAT_extended_sources_8years/Templates/"
-                elif de["version"] < 32:
-                    path_extended = (
-                        "$GAMMAPY_DATA/catalogs/fermi/Extended_12years/Templates/"
-                    )
-                else:
-                    path_extended = (
-                        "$GAMMAPY_DATA/catalogs/fermi/Extended_14years/Templates/"
-                    )
-                path = make_path(path_extended)
-                with warnings.catch_warnings():  # ignore FITS units warnings
-                    warnings.simplefilter("ignore", FITSFixedWarning)
-                    model = TemplateSpatialModel.read(path / filename)
-            elif morph_type == "2D Gaussian":
-                model = GaussianSpatialModel(
-                    lon_0=ra, lat_0=dec, sigma=sigma, e=e, phi=phi, frame="icrs"
-                )
-            else:
+            try:
+                make_model = _SPATIAL_MODELS_4FGL[morph_type]
+            except KeyError:
                 raise ValueError(f"Invalid spatial model: {morph_type!r}")
+
+            model = make_model(ra, dec, de, self._eccentricity)
         self._set_spatial_errors(model)
         return model
 
+    @_cached_model
     def spectral_model(self):
         """Best fit spectral model as a `~gammapy.modeling.models.SpectralModel` object."""
-        spec_type = self.data["SpectrumType"].strip()
-
-        if spec_type == "PowerLaw":
-            tag = "PowerLawSpectralModel"
-            pars = {
-                "reference": self.data["Pivot_Energy"],
-                "amplitude": self.data["PL_Flux_Density"],
-                "index": self.data["PL_Index"],
-            }
-            errs = {
-                "amplitude": self.data["Unc_PL_Flux_Density"],
-                "index": self.data["Unc_PL_Index"],
-            }
-        elif spec_type == "LogParabola":
-            tag = "LogParabolaSpectralModel"
-            pars = {
-                "reference": self.data["Pivot_Energy"],
-                "amplitude": self.data["LP_Flux_Density"],
-                "alpha": self.data["LP_Index"],
-                "beta": self.data["LP_beta"],
-            }
-            errs = {
-                "amplitude": self.data["Unc_LP_Flux_Density"],
-                "alpha": self.data["Unc_LP_Index"],
-                "beta": self.data["Unc_LP_beta"],
-            }
-        elif spec_type == "PLSuperExpCutoff":
-            if "PLEC_ExpfactorS" in self.data:
-                tag = "SuperExpCutoffPowerLaw4FGLDR3SpectralModel"
-                expfactor = self.data["PLEC_ExpfactorS"]
-                expfactor_err = self.data["Unc_PLEC_ExpfactorS"]
-                index_1 = self.data["PLEC_IndexS"]
-                index_1_err = self.data["Unc_PLEC_IndexS"]
-            else:
-                tag = "SuperExpCutoffPowerLaw4FGLSpectralModel"
-                expfactor = self.data["PLEC_Expfactor"]
-                expfactor_err = self.data["Unc_PLEC_Expfactor"]
-                index_1 = self.data["PLEC_Index"]
-                index_1_err = self.data["Unc_PLEC_Index"]
+        d = self.data
+        spec_type = self._spec_type
 
-            pars = {
-                "reference": self.data["Pivot_Energy"],
-                "amplitude": self.data["PLEC_Flux_Density"],
-                "index_1": index_1,
-                "index_2": self.data["PLEC_Exp_Index"],
-                "expfactor": expfactor,
-            }
-            errs = {
-                "amplitude": self.data["Unc_PLEC_Flux_Density"],
-                "index_1": index_1_err,
-                "index_2": np.nan_to_num(float(self.data["Unc_PLEC_Exp_Index"])),
-                "expfactor": expfactor_err,
-            }
-        else:
+        try:
+            get_pars = _SPECTRAL_MODEL_PARS_4FGL[spec_type]
+        except KeyError:
             raise ValueError(f"Invalid spec_type: {spec_type!r}")
 
+        tag, pars, errs = get_pars(d)
+
         model = Model.create(tag, "spectral", **pars)
 
         for name, value in errs.items():
@@ -598,45 +1061,32 @@ class SourceCatalogObject4FGL(SourceCatalogObjectFermiBase):
         return model
 
     @property
+    @_cached_table
     def flux_points_table(self):
         """Flux points as a `~astropy.table.Table`."""
-        table = Table()
-        table.meta.update(self.flux_points_meta)
-
-        table["e_min"] = self.data["fp_energy_edges"][:-1]
-        table["e_max"] = self.data["fp_energy_edges"][1:]
-
-        flux = self._get_flux_values("Flux_Band")
-        flux_err = self._get_flux_values("Unc_Flux_Band")
-        table["flux"] = flux
-        table["flux_errn"] = np.abs(flux_err[:, 0])
-        table["flux_errp"] = flux_err[:, 1]
-
-        nuFnu = self._get_flux_values("nuFnu_Band", "erg cm-2 s-1")
-        table["e2dnde"] = nuFnu
-        table["e2dnde_errn"] = np.abs(nuFnu * flux_err[:, 0] / flux)
-        table["e2dnde_errp"] = nuFnu * flux_err[:, 1] / flux
+        energy_edges = self.data["fp_energy_edges"]
 
-        is_ul = np.isnan(table["flux_errn"])
-        table["is_ul"] = is_ul
+        # precomputed for all sources by `SourceCatalog4FGL`
+        columns = self.data.get("fp_columns")
 
-        # handle upper limits
-        table["flux_ul"] = np.nan * flux_err.unit
-        flux_ul = compute_flux_points_ul(table["flux"], table["flux_errp"])
-        table["flux_ul"][is_ul] = flux_ul[is_ul]
-
-        # handle upper limits
-        table["e2dnde_ul"] = np.nan * nuFnu.unit
-        e2dnde_ul = compute_flux_points_ul(table["e2dnde"], table["e2dnde_errp"])
-        table["e2dnde_ul"][is_ul] = e2dnde_ul[is_ul]
+        if columns is None:
+            columns = _flux_points_columns(
+                flux=self._get_flux_values("Flux_Band"),
+                flux_err=self._get_flux_values("Unc_Flux_Band"),
+                e2dnde=self._get_flux_values("nuFnu_Band", "erg cm-2 s-1"),
+            )
 
+        data = {"e_min": energy_edges[:-1], "e_max": energy_edges[1:]}
+        data.update(columns)
         # Square root of test statistic
-        table["sqrt_ts"] = self.data["Sqrt_TS_Band"]
+        data["sqrt_ts"] = self.data["Sqrt_TS_Band"]
+        table = Table(data)
+        table.meta.update(self.flux_points_meta)
         return table
 
     def _get_flux_values(self, prefix, unit="cm-2 s-1"):
         values = self.data[prefix]
-        return u.Quantity(values, unit)
+        return u.Quantity(values, unit, copy=COPY_IF_NEEDED)
 
     def lightcurve(self, interval="1-year"):
         """Lightcurve as a `~gammapy.estimators.FluxPoints` object.
@@ -670,29 +1120,118 @@ class SourceCatalogObject4FGL(SourceCatalogObjectFermiBase):
         energy_axis = MapAxis.from_energy_edges([50, 300000] * u.MeV)
         geom = RegionGeom.create(region=self.position, axes=[energy_axis, time_axis])
 
-        names = ["flux", "flux_errp", "flux_errn", "flux_ul", "ts"]
-        maps = Maps.from_geom(geom=geom, names=names)
+        flux = u.Quantity(self.data[tag], copy=COPY_IF_NEEDED)
+        unit = flux.unit
+        flux = flux.value
+        flux_err = u.Quantity(self.data[f"Unc_{tag}"], unit, copy=COPY_IF_NEEDED).value
+        flux_errp = flux_err[:, 1]
+        sqrt_ts = np.asarray(self.data[tag_sqrt_ts])
 
-        maps["flux"].quantity = self.data[tag].reshape(geom.data_shape)
-        maps["flux_errp"].quantity = self.data[f"Unc_{tag}"][:, 1].reshape(
-            geom.data_shape
+        compute_lightcurve = get_fermi_kernels()["compute_lightcurve"]
+        flux_errn, flux_ul, ts = compute_lightcurve(
+            flux, flux_err[:, 0], flux_errp, sqrt_ts
         )
-        maps["flux_errn"].quantity = -self.data[f"Unc_{tag}"][:, 0].reshape(
-            geom.data_shape
+
+        # fill the maps with the raw arrays and set the units once
+        shape = geom.data_shape
+        maps = Maps(
+            flux=RegionNDMap(geom, data=flux.reshape(shape), unit=unit),
+            flux_errp=RegionNDMap(geom, data=flux_errp.reshape(shape), unit=unit),
+            flux_errn=RegionNDMap(geom, data=flux_errn.reshape(shape), unit=unit),
+            flux_ul=RegionNDMap(geom, data=flux_ul.reshape(shape), unit=unit),
+            ts=RegionNDMap(geom, data=ts.reshape(shape)),
         )
-        maps["flux_ul"].quantity = compute_flux_points_ul(
-            maps["flux"].quantity, maps["flux_errp"].quantity
-        ).reshape(geom.data_shape)
-        maps["ts"].quantity = (self.data[tag_sqrt_ts] ** 2).reshape(geom.data_shape)
 
         return FluxPoints.from_maps(
             maps=maps,
             sed_type="flux",
-            reference_model=self.sky_model(),
+            reference_model=self._reference_model(),
             meta=self.flux_points.meta.copy(),
         )
 
 
+def _spectral_model_pars_pl_3fgl(d):
+    tag = "PowerLawSpectralModel"
+    pars = {
+        "amplitude": d["Flux_Density"],
+        "reference": d["Pivot_Energy"],
+        "index": d["Spectral_Index"],
+    }
+    errs = {
+        "amplitude": d["Unc_Flux_Density"],
+        "index": d["Unc_Spectral_Index"],
+    }
+    return tag, pars, errs
+
+
+def _spectral_model_pars_plec_3fgl(d):
+    tag = "ExpCutoffPowerLaw3FGLSpectralModel"
+    pars = {
+        "amplitude": d["Flux_Density"],
+        "reference": d["Pivot_Energy"],
+        "index": d["Spectral_Index"],
+        "ecut": d["Cutoff"],
+    }
+    errs = {
+        "amplitude": d["Unc_Flux_Density"],
+        "index": d["Unc_Spectral_Index"],
+        "ecut": d["Unc_Cutoff"],
+    }
+    return tag, pars, errs
+
+
+def _spectral_model_pars_lp_3fgl(d):
+    tag = "LogParabolaSpectralModel"
+    pars = {
+        "amplitude": d["Flux_Density"],
+        "reference": d["Pivot_Energy"],
+        "alpha": d["Spectral_Index"],
+        "beta": d["beta"],
+    }
+    errs = {
+        "amplitude": d["Unc_Flux_Density"],
+        "alpha": d["Unc_Spectral_Index"],
+        "beta": d["Unc_beta"],
+    }
+    return tag, pars, errs
+
+
+def _spectral_model_pars_plsec_3fgl(d):
+    tag = "SuperExpCutoffPowerLaw3FGLSpectralModel"
+    pars = {
+        "amplitude": d["Flux_Density"],
+        "reference": d["Pivot_Energy"],
+        "index_1": d["Spectral_Index"],
+        "index_2": d["Exp_Index"],
+        "ecut": d["Cutoff"],
+    }
+    errs = {
+        "amplitude": d["Unc_Flux_Density"],
+        "index_1": d["Unc_Spectral_Index"],
+        "index_2": d["Unc_Exp_Index"],
+        "ecut": d["Unc_Cutoff"],
+    }
+    return tag, pars, errs
+
+
+# spectral model parameters and errors by "SpectrumType"
+_SPECTRAL_MODEL_PARS_3FGL = {
+    "PowerLaw": _spectral_model_pars_pl_3fgl,
+    "PLExpCutoff": _spectral_model_pars_plec_3fgl,
+    "LogParabola": _spectral_model_pars_lp_3fgl,
+    "PLSuperExpCutoff": _spectral_model_pars_plsec_3fgl,
+}
+
+# spatial models by "Model_Form"
+_SPATIAL_MODELS_3FGL = {
+    "Disk": _spatial_model_disk,
+    "Map": _spatial_model_template_v15,
+    "Ring": _spatial_model_template_v15,
+    "2D Gaussian x2": _spatial_model_template_v15,
+    "2D Gaussian": _spatial_model_gauss,
+}
+
+
 class SourceCatalogObject3FGL(SourceCatalogObjectFermiBase):
     """One source from the Fermi-LAT 3FGL catalog.
 
@@ -700,6 +1239,8 @@ class SourceCatalogObject3FGL(SourceCatalogObjectFermiBase):
     """
 
     _energy_edges = u.Quantity([100, 300, 1000, 3000, 10000, 100000], "MeV")
+    _energy_min = _energy_edges[:-1]
+    _energy_max = _energy_edges[1:]
     _energy_edges_suffix = [
         "100_300",
         "300_1000",
@@ -707,6 +1248,9 @@ class SourceCatalogObject3FGL(SourceCatalogObjectFermiBase):
         "3000_10000",
         "10000_100000",
     ]
+    _band_columns = _band_column_names(
+        ["Flux", "Unc_Flux", "nuFnu", "Sqrt_TS"], _energy_edges_suffix
+    )
     energy_range = u.Quantity([100, 100000], "MeV")
     """Energy range used for the catalog.
 
@@ -717,168 +1261,117 @@ class SourceCatalogObject3FGL(SourceCatalogObjectFermiBase):
 
     def _info_more(self):
         d = self.data
-        ss = "\n*** Other info ***\n\n"
-        ss += "{:<20s} : {}\n".format("Other flags", d["Flags"])
-        return ss
+        ss = "\n*** Other info ***\n\nOther flags          : {Flags}\n"
+        return ss.format_map(d)
 
     def _info_spectral_fit(self):
         d = self.data
-        spec_type = d["SpectrumType"].strip()
+        spec_type = self._spec_type
 
-        ss = "\n*** Spectral info ***\n\n"
+        ss = ["\n*** Spectral info ***\n\n"]
 
-        ss += "{:<45s} : {}\n".format("Spectrum type", d["SpectrumType"])
+        ss.append("{:<45s} : {}\n".format("Spectrum type", d["SpectrumType"]))
         fmt = "{:<45s} : {:.3f}\n"
-        ss += fmt.format("Detection significance (100 MeV - 300 GeV)", d["Signif_Avg"])
-        ss += "{:<45s} : {:.1f}\n".format("Significance curvature", d["Signif_Curve"])
+        ss.append(
+            fmt.format("Detection significance (100 MeV - 300 GeV)", d["Signif_Avg"])
+        )
+        ss.append(
+            "{:<45s} : {:.1f}\n".format("Significance curvature", d["Signif_Curve"])
+        )
 
         if spec_type == "PowerLaw":
             pass
         elif spec_type == "LogParabola":
-            ss += "{:<45s} : {} +- {}\n".format("beta", d["beta"], d["Unc_beta"])
+            ss.append("{:<45s} : {} +- {}\n".format("beta", d["beta"], d["Unc_beta"]))
         elif spec_type in ["PLExpCutoff", "PlSuperExpCutoff"]:
             fmt = "{:<45s} : {:.0f} +- {:.0f} {}\n"
-            ss += fmt.format(
-                "Cutoff energy",
-                d["Cutoff"].value,
-                d["Unc_Cutoff"].value,
-                d["Cutoff"].unit,
+            ss.append(
+                fmt.format(
+                    "Cutoff energy",
+                    d["Cutoff"].value,
+                    d["Unc_Cutoff"].value,
+                    d["Cutoff"].unit,
+                )
             )
         elif spec_type == "PLSuperExpCutoff":
-            ss += "{:<45s} : {} +- {}\n".format(
-                "Super-exponential cutoff index", d["Exp_Index"], d["Unc_Exp_Index"]
+            ss.append(
+                "{:<45s} : {} +- {}\n".format(
+                    "Super-exponential cutoff index", d["Exp_Index"], d["Unc_Exp_Index"]
+                )
             )
         else:
             raise ValueError(f"Invalid spec_type: {spec_type!r}")
 
-        ss += "{:<45s} : {:.0f} {}\n".format(
-            "Pivot energy", d["Pivot_Energy"].value, d["Pivot_Energy"].unit
+        ss.append(
+            "{:<45s} : {:.0f} {}\n".format(
+                "Pivot energy", d["Pivot_Energy"].value, d["Pivot_Energy"].unit
+            )
         )
 
-        ss += "{:<45s} : {:.3f}\n".format(
-            "Power law spectral index", d["PowerLaw_Index"]
+        ss.append(
+            "{:<45s} : {:.3f}\n".format("Power law spectral index", d["PowerLaw_Index"])
         )
 
         fmt = "{:<45s} : {:.3f} +- {:.3f}\n"
-        ss += fmt.format("Spectral index", d["Spectral_Index"], d["Unc_Spectral_Index"])
-
-        fmt = "{:<45s} : {:.3} +- {:.3} {}\n"
-        ss += fmt.format(
-            "Flux Density at pivot energy",
-            d["Flux_Density"].value,
-            d["Unc_Flux_Density"].value,
-            "cm-2 MeV-1 s-1",
+        ss.append(
+            fmt.format("Spectral index", d["Spectral_Index"], d["Unc_Spectral_Index"])
         )
 
-        fmt = "{:<45s} : {:.3} +- {:.3} {}\n"
-        ss += fmt.format(
-            "Integral flux (1 - 100 GeV)",
-            d["Flux1000"].value,
-            d["Unc_Flux1000"].value,
-            "cm-2 s-1",
-        )
-
-        fmt = "{:<45s} : {:.3} +- {:.3} {}\n"
-        ss += fmt.format(
-            "Energy flux (100 MeV - 100 GeV)",
-            d["Energy_Flux100"].value,
-            d["Unc_Energy_Flux100"].value,
-            "erg cm-2 s-1",
-        )
-
-        return ss
-
-    def _info_lightcurve(self):
-        d = self.data
-        ss = "\n*** Lightcurve info ***\n\n"
-        ss += "Lightcurve measured in the energy band: 100 MeV - 100 GeV\n\n"
-
-        ss += "{:<15s} : {:.3f}\n".format("Variability index", d["Variability_Index"])
-
-        if np.isfinite(d["Flux_Peak"]):
-            ss += "{:<40s} : {:.3f}\n".format(
-                "Significance peak (100 MeV - 100 GeV)", d["Signif_Peak"]
-            )
-
-            fmt = "{:<40s} : {:.3} +- {:.3} cm^-2 s^-1\n"
-            ss += fmt.format(
-                "Integral flux peak (100 MeV - 100 GeV)",
-                d["Flux_Peak"].value,
-                d["Unc_Flux_Peak"].value,
+        ss.append(
+            _info_flux(
+                "Flux Density at pivot energy",
+                d["Flux_Density"],
+                d["Unc_Flux_Density"],
+                "cm-2 MeV-1 s-1",
             )
-
-            # TODO: give time as UTC string, not MET
-            ss += "{:<40s} : {:.3} s (Mission elapsed time)\n".format(
-                "Time peak", d["Time_Peak"].value
+        )
+        ss.append(
+            _info_flux(
+                "Integral flux (1 - 100 GeV)",
+                d["Flux1000"],
+                d["Unc_Flux1000"],
+                "cm-2 s-1",
             )
-            peak_interval = d["Peak_Interval"].to_value("day")
-            ss += "{:<40s} : {:.3} day\n".format("Peak interval", peak_interval)
-        else:
-            ss += "\nNo peak measured for this source.\n"
-
-        # TODO: Add a lightcurve table with d['Flux_History'] and d['Unc_Flux_History']
-
-        return ss
-
-    def spectral_model(self):
-        """Best fit spectral model as a `~gammapy.modeling.models.SpectralModel` object."""
-        spec_type = self.data["SpectrumType"].strip()
-
-        if spec_type == "PowerLaw":
-            tag = "PowerLawSpectralModel"
-            pars = {
-                "amplitude": self.data["Flux_Density"],
-                "reference": self.data["Pivot_Energy"],
-                "index": self.data["Spectral_Index"],
-            }
-            errs = {
-                "amplitude": self.data["Unc_Flux_Density"],
-                "index": self.data["Unc_Spectral_Index"],
-            }
-        elif spec_type == "PLExpCutoff":
-            tag = "ExpCutoffPowerLaw3FGLSpectralModel"
-            pars = {
-                "amplitude": self.data["Flux_Density"],
-                "reference": self.data["Pivot_Energy"],
-                "index": self.data["Spectral_Index"],
-                "ecut": self.data["Cutoff"],
-            }
-            errs = {
-                "amplitude": self.data["Unc_Flux_Density"],
-                "index": self.data["Unc_Spectral_Index"],
-                "ecut": self.data["Unc_Cutoff"],
-            }
-        elif spec_type == "LogParabola":
-            tag = "LogParabolaSpectralModel"
-            pars = {
-                "amplitude": self.data["Flux_Density"],
-                "reference": self.data["Pivot_Energy"],
-                "alpha": self.data["Spectral_Index"],
-                "beta": self.data["beta"],
-            }
-            errs = {
-                "amplitude": self.data["Unc_Flux_Density"],
-                "alpha": self.data["Unc_Spectral_Index"],
-                "beta": self.data["Unc_beta"],
-            }
-        elif spec_type == "PLSuperExpCutoff":
-            tag = "SuperExpCutoffPowerLaw3FGLSpectralModel"
-            pars = {
-                "amplitude": self.data["Flux_Density"],
-                "reference": self.data["Pivot_Energy"],
-                "index_1": self.data["Spectral_Index"],
-                "index_2": self.data["Exp_Index"],
-                "ecut": self.data["Cutoff"],
-            }
-            errs = {
-                "amplitude": self.data["Unc_Flux_Density"],
-                "index_1": self.data["Unc_Spectral_Index"],
-                "index_2": self.data["Unc_Exp_Index"],
-                "ecut": self.data["Unc_Cutoff"],
-            }
+        )
+        ss.append(
+            _info_flux(
+                "Energy flux (100 MeV - 100 GeV)",
+                d["Energy_Flux100"],
+                d["Unc_Energy_Flux100"],
+                "erg cm-2 s-1",
+            )
+        )
+
+        return "".join(ss)
+
+    def _info_lightcurve(self):
+        d = self.data
+        ss = [_INFO_LIGHTCURVE_TEMPLATE.format_map(d)]
+
+        if np.isfinite(d["Flux_Peak"]):
+            ss.append(_INFO_LIGHTCURVE_PEAK_TEMPLATE.format_map(d))
+            peak_interval = d["Peak_Interval"].to_value("day")
+            ss.append("{:<40s} : {:.3} day\n".format("Peak interval", peak_interval))
         else:
+            ss.append("\nNo peak measured for this source.\n")
+
+        # TODO: Add a lightcurve table with d['Flux_History'] and d['Unc_Flux_History']
+
+        return "".join(ss)
+
+    @_cached_model
+    def spectral_model(self):
+        """Best fit spectral model as a `~gammapy.modeling.models.SpectralModel` object."""
+        d = self.data
+        spec_type = self._spec_type
+
+        try:
+            get_pars = _SPECTRAL_MODEL_PARS_3FGL[spec_type]
+        except KeyError:
             raise ValueError(f"Invalid spec_type: {spec_type!r}")
 
+        tag, pars, errs = get_pars(d)
+
         model = Model.create(tag, "spectral", **pars)
 
         for name, value in errs.items():
@@ -886,6 +1379,7 @@ class SourceCatalogObject3FGL(SourceCatalogObjectFermiBase):
 
         return model
 
+    @_cached_model
     def spatial_model(self):
         """Spatial model as a `~gammapy.modeling.models.SpatialModel` object."""
         d = self.data
@@ -897,69 +1391,46 @@ class SourceCatalogObject3FGL(SourceCatalogObjectFermiBase):
         else:
             de = self.data_extended
             morph_type = de["Model_Form"].strip()
-            e = (1 - (de["Model_SemiMinor"] / de["Model_SemiMajor"]) ** 2.0) ** 0.5
-            sigma = de["Model_SemiMajor"]
-            phi = de["Model_PosAng"]
-            if morph_type == "Disk":
-                r_0 = de["Model_SemiMajor"]
-                model = DiskSpatialModel(
-                    lon_0=ra, lat_0=dec, r_0=r_0, e=e, phi=phi, frame="icrs"
-                )
-            elif morph_type in ["Map", "Ring", "2D Gaussian x2"]:
-                filename = de["Spatial_Filename"].strip()
-                path = make_path(
-                    "$GAMMAPY_DATA/catalogs/fermi/Extended_archive_v15/Templates/"
-                )
-                model = TemplateSpatialModel.read(path / filename)
-            elif morph_type == "2D Gaussian":
-                model = GaussianSpatialModel(
-                    lon_0=ra, lat_0=dec, sigma=sigma, e=e, phi=phi, frame="icrs"
-                )
-            else:
+            try:
+                make_model = _SPATIAL_MODELS_3FGL[morph_type]
+            except KeyError:
                 raise ValueError(f"Invalid spatial model: {morph_type!r}")
+
+            model = make_model(ra, dec, de, self._eccentricity)
         self._set_spatial_errors(model)
         return model
 
     @property
+    @_cached_table
     def flux_points_table(self):
         """Flux points as a `~astropy.table.Table`."""
-        table = Table()
-        table.meta.update(self.flux_points_meta)
-
-        table["e_min"] = self._energy_edges[:-1]
-        table["e_max"] = self._energy_edges[1:]
-
-        flux = self._get_flux_values("Flux")
-        flux_err = self._get_flux_values("Unc_Flux")
-        table["flux"] = flux
-        table["flux_errn"] = np.abs(flux_err[:, 0])
-        table["flux_errp"] = flux_err[:, 1]
-
-        nuFnu = self._get_flux_values("nuFnu", "erg cm-2 s-1")
-        table["e2dnde"] = nuFnu
-        table["e2dnde_errn"] = np.abs(nuFnu * flux_err[:, 0] / flux)
-        table["e2dnde_errp"] = nuFnu * flux_err[:, 1] / flux
-
-        is_ul = np.isnan(table["flux_errn"])
-        table["is_ul"] = is_ul
+        columns = _flux_points_columns(
+            flux=self._get_flux_values("Flux"),
+            flux_err=self._get_flux_values("Unc_Flux"),
+            e2dnde=self._get_flux_values("nuFnu", "erg cm-2 s-1"),
+        )
 
-        # handle upper limits
-        table["flux_ul"] = np.nan * flux_err.unit
-        flux_ul = compute_flux_points_ul(table["flux"], table["flux_errp"])
-        table["flux_ul"][is_ul] = flux_ul[is_ul]
+        data = {"e_min": self._energy_min, "e_max": self._energy_max}
+        data.update(columns)
+        # Square root of test statistic, precomputed by `SourceCatalog3FGL`
+        sqrt_ts = self.data.get("sqrt_ts")
 
-        # handle upper limits
-        table["e2dnde_ul"] = np.nan * nuFnu.unit
-        e2dnde_ul = compute_flux_points_ul(table["e2dnde"], table["e2dnde_errp"])
-        table["e2dnde_ul"][is_ul] = e2dnde_ul[is_ul]
+        if sqrt_ts is None:
+            sqrt_ts = [self.data[_] for _ in self._band_columns["Sqrt_TS"]]
 
-        # Square root of test statistic
-        table["sqrt_ts"] = [self.data["Sqrt_TS" + _] for _ in self._energy_edges_suffix]
+        data["sqrt_ts"] = sqrt_ts
+        table = Table(data)
+        table.meta.update(self.flux_points_meta)
         return table
 
     def _get_flux_values(self, prefix, unit="cm-2 s-1"):
-        values = [self.data[prefix + _] for _ in self._energy_edges_suffix]
-        return u.Quantity(values, unit)
+        cache = self.__dict__.setdefault("_flux_values_cache", {})
+
+        if (prefix, unit) not in cache:
+            values = [self.data[_] for _ in self._band_columns[prefix]]
+            cache[prefix, unit] = u.Quantity(values, unit, copy=COPY_IF_NEEDED)
+
+        return cache[prefix, unit]
 
     def lightcurve(self):
         """Lightcurve as a `~gammapy.estimators.FluxPoints` object."""
@@ -969,30 +1440,46 @@ class SourceCatalogObject3FGL(SourceCatalogObjectFermiBase):
         energy_axis = MapAxis.from_energy_edges(self.energy_range)
         geom = RegionGeom.create(region=self.position, axes=[energy_axis, time_axis])
 
-        names = ["flux", "flux_errp", "flux_errn", "flux_ul"]
-        maps = Maps.from_geom(geom=geom, names=names)
-
-        maps["flux"].quantity = self.data[tag].reshape(geom.data_shape)
-        maps["flux_errp"].quantity = self.data[f"Unc_{tag}"][:, 1].reshape(
-            geom.data_shape
-        )
-        maps["flux_errn"].quantity = -self.data[f"Unc_{tag}"][:, 0].reshape(
-            geom.data_shape
+        flux = u.Quantity(self.data[tag], copy=COPY_IF_NEEDED)
+        unit = flux.unit
+        flux = flux.value
+        flux_err = u.Quantity(self.data[f"Unc_{tag}"], unit, copy=COPY_IF_NEEDED).value
+        flux_errp = flux_err[:, 1]
+        flux_errn = -flux_err[:, 0]
+
+        is_ul = np.isnan(flux_errn)
+        flux_ul = np.full_like(flux_errn, np.nan)
+        flux_ul[is_ul] = compute_flux_points_ul(flux[is_ul], flux_errp[is_ul])
+
+        # fill the maps with the raw arrays and set the units once
+        shape = geom.data_shape
+        maps = Maps(
+            flux=RegionNDMap(geom, data=flux.reshape(shape), unit=unit),
+            flux_errp=RegionNDMap(geom, data=flux_errp.reshape(shape), unit=unit),
+            flux_errn=RegionNDMap(geom, data=flux_errn.reshape(shape), unit=unit),
+            flux_ul=RegionNDMap(geom, data=flux_ul.reshape(shape), unit=unit),
         )
-        maps["flux_ul"].quantity = compute_flux_points_ul(
-            maps["flux"].quantity, maps["flux_errp"].quantity
-        ).reshape(geom.data_shape)
-        is_ul = np.isnan(maps["flux_errn"])
-        maps["flux_ul"].data[~is_ul] = np.nan
 
         return FluxPoints.from_maps(
             maps=maps,
             sed_type="flux",
-            reference_model=self.sky_model(),
+            reference_model=self._reference_model(),
             meta=self.flux_points_meta.copy(),
         )
 
 
+# spatial models by "Model_Form"
+_SPATIAL_MODELS_2FHL = {
+    "Disk": _spatial_model_disk,
+    "Elliptical Disk": _spatial_model_disk,
+    "Map": _spatial_model_template_v15,
+    "Ring": _spatial_model_template_v15,
+    "2D Gaussian x2": _spatial_model_template_v15,
+    "2D Gaussian": _spatial_model_gauss,
+    "Elliptical 2D Gaussian": _spatial_model_gauss,
+}
+
+
 class SourceCatalogObject2FHL(SourceCatalogObjectFermiBase):
     """One source from the Fermi-LAT 2FHL catalog.
 
@@ -1001,60 +1488,56 @@ class SourceCatalogObject2FHL(SourceCatalogObjectFermiBase):
 
     asso = ["ASSOC", "3FGL_Name", "1FHL_Name", "TeVCat_Name"]
     _energy_edges = u.Quantity([50, 171, 585, 2000], "GeV")
+    _energy_min = _energy_edges[:-1]
+    _energy_max = _energy_edges[1:]
     _energy_edges_suffix = ["50_171", "171_585", "585_2000"]
+    _band_columns = _band_column_names(
+        ["Flux", "Unc_Flux"], _energy_edges_suffix, postfix="GeV"
+    )
     energy_range = u.Quantity([0.05, 2], "TeV")
     """Energy range used for the catalog."""
 
     def _info_more(self):
         d = self.data
-        ss = "\n*** Other info ***\n\n"
-        fmt = "{:<32s} : {:.3f}\n"
-        ss += fmt.format("Test statistic (50 GeV - 2 TeV)", d["TS"])
-        return ss
+        return (
+            "\n*** Other info ***\n\n"
+            f"{'Test statistic (50 GeV - 2 TeV)':<32s} : {d['TS']:.3f}\n"
+        )
 
     def _info_position(self):
         d = self.data
-        ss = "\n*** Position info ***\n\n"
-        ss += "{:<20s} : {:.3f}\n".format("RA", d["RAJ2000"])
-        ss += "{:<20s} : {:.3f}\n".format("DEC", d["DEJ2000"])
-        ss += "{:<20s} : {:.3f}\n".format("GLON", d["GLON"])
-        ss += "{:<20s} : {:.3f}\n".format("GLAT", d["GLAT"])
-
-        ss += "\n"
-        ss += "{:<20s} : {:.4f}\n".format("Error on position (68%)", d["Pos_err_68"])
-        ss += "{:<20s} : {:.0f}\n".format("ROI number", d["ROI"])
-        return ss
+        ss = _INFO_POSITION_TEMPLATE + (
+            "Error on position (68%) : {Pos_err_68:.4f}\n"
+            "ROI number           : {ROI:.0f}\n"
+        )
+        return ss.format_map(d)
 
     def _info_spectral_fit(self):
         d = self.data
+        index, index_err = d["Spectral_Index"], d["Unc_Spectral_Index"]
+        flux, flux_err = d["Flux50"].value, d["Unc_Flux50"].value
+        eflux, eflux_err = d["Energy_Flux50"].value, d["Unc_Energy_Flux50"].value
 
-        ss = "\n*** Spectral fit info ***\n\n"
-
-        fmt = "{:<32s} : {:.3f} +- {:.3f}\n"
-        ss += fmt.format(
-            "Power-law spectral index", d["Spectral_Index"], d["Unc_Spectral_Index"]
-        )
-
-        ss += "{:<32s} : {:.3} +- {:.3} {}\n".format(
-            "Integral flux (50 GeV - 2 TeV)",
-            d["Flux50"].value,
-            d["Unc_Flux50"].value,
-            "cm-2 s-1",
-        )
-
-        ss += "{:<32s} : {:.3} +- {:.3} {}\n".format(
-            "Energy flux (50 GeV - 2 TeV)",
-            d["Energy_Flux50"].value,
-            d["Unc_Energy_Flux50"].value,
-            "erg cm-2 s-1",
+        return "".join(
+            [
+                "\n*** Spectral fit info ***\n\n",
+                f"{'Power-law spectral index':<32s} : {index:.3f} +- {index_err:.3f}\n",
+                f"{'Integral flux (50 GeV - 2 TeV)':<32s} : "
+                f"{flux:.3} +- {flux_err:.3} cm-2 s-1\n",
+                f"{'Energy flux (50 GeV - 2 TeV)':<32s} : "
+                f"{eflux:.3} +- {eflux_err:.3} erg cm-2 s-1\n",
+            ]
         )
 
-        return ss
-
     @property
     def is_pointlike(self):
+        is_pointlike = self.data.get("is_pointlike")
+        if is_pointlike is not None:
+            return is_pointlike
+
         return self.data["Source_Name"].strip()[-1] != "e"
 
+    @_cached_model
     def spatial_model(self):
         """Spatial model as a `~gammapy.modeling.models.SpatialModel` object."""
         d = self.data
@@ -1066,42 +1549,29 @@ class SourceCatalogObject2FHL(SourceCatalogObjectFermiBase):
         else:
             de = self.data_extended
             morph_type = de["Model_Form"].strip()
-            e = (1 - (de["Model_SemiMinor"] / de["Model_SemiMajor"]) ** 2.0) ** 0.5
-            sigma = de["Model_SemiMajor"]
-            phi = de["Model_PosAng"]
-            if morph_type in ["Disk", "Elliptical Disk"]:
-                r_0 = de["Model_SemiMajor"]
-                model = DiskSpatialModel(
-                    lon_0=ra, lat_0=dec, r_0=r_0, e=e, phi=phi, frame="icrs"
-                )
-            elif morph_type in ["Map", "Ring", "2D Gaussian x2"]:
-                filename = de["Spatial_Filename"].strip()
-                path = make_path(
-                    "$GAMMAPY_DATA/catalogs/fermi/Extended_archive_v15/Templates/"
-                )
-                return TemplateSpatialModel.read(path / filename)
-            elif morph_type in ["2D Gaussian", "Elliptical 2D Gaussian"]:
-                model = GaussianSpatialModel(
-                    lon_0=ra, lat_0=dec, sigma=sigma, e=e, phi=phi, frame="icrs"
-                )
-            else:
+            try:
+                make_model = _SPATIAL_MODELS_2FHL[morph_type]
+            except KeyError:
                 raise ValueError(f"Invalid spatial model: {morph_type!r}")
 
+            model = make_model(ra, dec, de, self._eccentricity)
         self._set_spatial_errors(model)
         return model
 
+    @_cached_model
     def spectral_model(self):
         """Best fit spectral model as a `~gammapy.modeling.models.SpectralModel`."""
+        d = self.data
         tag = "PowerLaw2SpectralModel"
         pars = {
-            "amplitude": self.data["Flux50"],
+            "amplitude": d["Flux50"],
             "emin": self.energy_range[0],
             "emax": self.energy_range[1],
-            "index": self.data["Spectral_Index"],
+            "index": d["Spectral_Index"],
         }
         errs = {
-            "amplitude": self.data["Unc_Flux50"],
-            "index": self.data["Unc_Spectral_Index"],
+            "amplitude": d["Unc_Flux50"],
+            "index": d["Unc_Spectral_Index"],
         }
 
         model = Model.create(tag, "spectral", **pars)
@@ -1112,28 +1582,84 @@ class SourceCatalogObject2FHL(SourceCatalogObjectFermiBase):
         return model
 
     @property
+    @_cached_table
     def flux_points_table(self):
         """Flux points as a `~astropy.table.Table`."""
-        table = Table()
-        table.meta.update(self.flux_points_meta)
-        table["e_min"] = self._energy_edges[:-1]
-        table["e_max"] = self._energy_edges[1:]
-        table["flux"] = self._get_flux_values("Flux")
+        flux = self._get_flux_values("Flux")
         flux_err = self._get_flux_values("Unc_Flux")
-        table["flux_errn"] = np.abs(flux_err[:, 0])
-        table["flux_errp"] = flux_err[:, 1]
+        flux_errn = -flux_err[:, 0]
+        flux_errp = flux_err[:, 1]
 
         # handle upper limits
-        is_ul = np.isnan(table["flux_errn"])
-        table["is_ul"] = is_ul
-        table["flux_ul"] = np.nan * flux_err.unit
-        flux_ul = compute_flux_points_ul(table["flux"], table["flux_errp"])
-        table["flux_ul"][is_ul] = flux_ul[is_ul]
+        is_ul = np.isnan(flux_errn)
+        flux_ul = np.full(flux.shape, np.nan) << flux.unit
+        flux_ul[is_ul] = compute_flux_points_ul(flux[is_ul], flux_errp[is_ul])
+
+        data = {
+            "e_min": self._energy_min,
+            "e_max": self._energy_max,
+            "flux": flux,
+            "flux_errn": flux_errn,
+            "flux_errp": flux_errp,
+            "is_ul": is_ul,
+            "flux_ul": flux_ul,
+        }
+        table = Table(data)
+        table.meta.update(self.flux_points_meta)
         return table
 
     def _get_flux_values(self, prefix, unit="cm-2 s-1"):
-        values = [self.data[prefix + _ + "GeV"] for _ in self._energy_edges_suffix]
-        return u.Quantity(values, unit)
+        cache = self.__dict__.setdefault("_flux_values_cache", {})
+
+        if (prefix, unit) not in cache:
+            values = [self.data[_] for _ in self._band_columns[prefix]]
+            cache[prefix, unit] = u.Quantity(values, unit, copy=COPY_IF_NEEDED)
+
+        return cache[prefix, unit]
+
+
+def _spectral_model_pars_pl_3fhl(d):
+    tag = "PowerLawSpectralModel"
+    pars = {
+        "reference": d["Pivot_Energy"],
+        "amplitude": d["Flux_Density"],
+        "index": d["PowerLaw_Index"],
+    }
+    errs = {
+        "amplitude": d["Unc_Flux_Density"],
+        "index": d["Unc_PowerLaw_Index"],
+    }
+    return tag, pars, errs
+
+
+def _spectral_model_pars_lp_3fhl(d):
+    tag = "LogParabolaSpectralModel"
+    pars = {
+        "reference": d["Pivot_Energy"],
+        "amplitude": d["Flux_Density"],
+        "alpha": d["Spectral_Index"],
+        "beta": d["beta"],
+    }
+    errs = {
+        "amplitude": d["Unc_Flux_Density"],
+        "alpha": d["Unc_Spectral_Index"],
+        "beta": d["Unc_beta"],
+    }
+    return tag, pars, errs
+
+
+# spectral model parameters and errors by "SpectrumType"
+_SPECTRAL_MODEL_PARS_3FHL = {
+    "PowerLaw": _spectral_model_pars_pl_3fhl,
+    "LogParabola": _spectral_model_pars_lp_3fhl,
+}
+
+# spatial models by "Spatial_Function"
+_SPATIAL_MODELS_3FHL = {
+    "RadialDisk": _spatial_model_disk,
+    "SpatialMap": _spatial_model_template_v18,
+    "RadialGauss": _spatial_model_gauss,
+}
 
 
 class SourceCatalogObject3FHL(SourceCatalogObjectFermiBase):
@@ -1147,136 +1673,117 @@ class SourceCatalogObject3FHL(SourceCatalogObjectFermiBase):
     """Energy range used for the catalog."""
 
     _energy_edges = u.Quantity([10, 20, 50, 150, 500, 2000], "GeV")
+    _energy_min = _energy_edges[:-1]
+    _energy_max = _energy_edges[1:]
 
     def _info_position(self):
         d = self.data
-        ss = "\n*** Position info ***\n\n"
-        ss += "{:<20s} : {:.3f}\n".format("RA", d["RAJ2000"])
-        ss += "{:<20s} : {:.3f}\n".format("DEC", d["DEJ2000"])
-        ss += "{:<20s} : {:.3f}\n".format("GLON", d["GLON"])
-        ss += "{:<20s} : {:.3f}\n".format("GLAT", d["GLAT"])
-
         # TODO: All sources are non-elliptical; just give one number for radius?
-        ss += "\n"
-        ss += "{:<20s} : {:.4f}\n".format("Semimajor (95%)", d["Conf_95_SemiMajor"])
-        ss += "{:<20s} : {:.4f}\n".format("Semiminor (95%)", d["Conf_95_SemiMinor"])
-        ss += "{:<20s} : {:.2f}\n".format("Position angle (95%)", d["Conf_95_PosAng"])
-        ss += "{:<20s} : {:.0f}\n".format("ROI number", d["ROI_num"])
-
-        return ss
+        ss = _INFO_POSITION_TEMPLATE + (
+            "Semimajor (95%)      : {Conf_95_SemiMajor:.4f}\n"
+            "Semiminor (95%)      : {Conf_95_SemiMinor:.4f}\n"
+            "Position angle (95%) : {Conf_95_PosAng:.2f}\n"
+            "ROI number           : {ROI_num:.0f}\n"
+        )
+        return ss.format_map(d)
 
     def _info_spectral_fit(self):
         d = self.data
-        spec_type = d["SpectrumType"].strip()
-
-        ss = "\n*** Spectral fit info ***\n\n"
+        spec_type = self._spec_type
 
-        ss += "{:<32s} : {}\n".format("Spectrum type", d["SpectrumType"])
-        ss += "{:<32s} : {:.1f}\n".format("Significance curvature", d["Signif_Curve"])
-
-        # Power-law parameters are always given; give in any case
         fmt = "{:<32s} : {:.3f} +- {:.3f}\n"
-        ss += fmt.format(
-            "Power-law spectral index", d["PowerLaw_Index"], d["Unc_PowerLaw_Index"]
-        )
+        ss = [
+            "\n*** Spectral fit info ***\n\n",
+            f"{'Spectrum type':<32s} : {d['SpectrumType']}\n",
+            f"{'Significance curvature':<32s} : {d['Signif_Curve']:.1f}\n",
+            # Power-law parameters are always given; give in any case
+            fmt.format(
+                "Power-law spectral index",
+                d["PowerLaw_Index"],
+                d["Unc_PowerLaw_Index"],
+            ),
+        ]
 
         if spec_type == "PowerLaw":
             pass
         elif spec_type == "LogParabola":
-            fmt = "{:<32s} : {:.3f} +- {:.3f}\n"
-            ss += fmt.format(
-                "LogParabolaSpectralModel spectral index",
-                d["Spectral_Index"],
-                d["Unc_Spectral_Index"],
+            ss.append(
+                fmt.format(
+                    "LogParabolaSpectralModel spectral index",
+                    d["Spectral_Index"],
+                    d["Unc_Spectral_Index"],
+                )
             )
-
-            ss += "{:<32s} : {:.3f} +- {:.3f}\n".format(
-                "LogParabolaSpectralModel beta", d["beta"], d["Unc_beta"]
+            ss.append(
+                fmt.format("LogParabolaSpectralModel beta", d["beta"], d["Unc_beta"])
             )
         else:
             raise ValueError(f"Invalid spec_type: {spec_type!r}")
 
-        ss += "{:<32s} : {:.1f} {}\n".format(
-            "Pivot energy", d["Pivot_Energy"].value, d["Pivot_Energy"].unit
+        pivot_energy = d["Pivot_Energy"]
+        ss.append(
+            f"{'Pivot energy':<32s} : {pivot_energy.value:.1f} {pivot_energy.unit}\n"
         )
 
-        ss += "{:<32s} : {:.3} +- {:.3} {}\n".format(
-            "Flux Density at pivot energy",
-            d["Flux_Density"].value,
-            d["Unc_Flux_Density"].value,
-            "cm-2 GeV-1 s-1",
+        ss.append(
+            _info_flux(
+                "Flux Density at pivot energy",
+                d["Flux_Density"],
+                d["Unc_Flux_Density"],
+                "cm-2 GeV-1 s-1",
+                width=32,
+            )
         )
-
-        ss += "{:<32s} : {:.3} +- {:.3} {}\n".format(
-            "Integral flux (10 GeV - 1 TeV)",
-            d["Flux"].value,
-            d["Unc_Flux"].value,
-            "cm-2 s-1",
+        ss.append(
+            _info_flux(
+                "Integral flux (10 GeV - 1 TeV)",
+                d["Flux"],
+                d["Unc_Flux"],
+                "cm-2 s-1",
+                width=32,
+            )
         )
-
-        ss += "{:<32s} : {:.3} +- {:.3} {}\n".format(
-            "Energy flux (10 GeV - TeV)",
-            d["Energy_Flux"].value,
-            d["Unc_Energy_Flux"].value,
-            "erg cm-2 s-1",
+        ss.append(
+            _info_flux(
+                "Energy flux (10 GeV - TeV)",
+                d["Energy_Flux"],
+                d["Unc_Energy_Flux"],
+                "erg cm-2 s-1",
+                width=32,
+            )
         )
-
-        return ss
+        return "".join(ss)
 
     def _info_more(self):
         d = self.data
-        ss = "\n*** Other info ***\n\n"
-
-        fmt = "{:<32s} : {:.3f}\n"
-        ss += fmt.format("Significance (10 GeV - 2 TeV)", d["Signif_Avg"])
-        ss += "{:<32s} : {:.1f}\n".format("Npred", d["Npred"])
-
-        ss += "\n{:<16s} : {:.3f} {}\n".format(
-            "HEP Energy", d["HEP_Energy"].value, d["HEP_Energy"].unit
-        )
-        ss += "{:<16s} : {:.3f}\n".format("HEP Probability", d["HEP_Prob"])
-
-        ss += "{:<16s} : {}\n".format("Bayesian Blocks", d["Variability_BayesBlocks"])
-
-        ss += "{:<16s} : {:.3f}\n".format("Redshift", d["Redshift"])
-        ss += "{:<16s} : {:.3} {}\n".format(
-            "NuPeak_obs", d["NuPeak_obs"].value, d["NuPeak_obs"].unit
+        hep_energy = d["HEP_Energy"]
+        nupeak_obs = d["NuPeak_obs"]
+        return "".join(
+            [
+                "\n*** Other info ***\n\n",
+                f"{'Significance (10 GeV - 2 TeV)':<32s} : {d['Signif_Avg']:.3f}\n",
+                f"{'Npred':<32s} : {d['Npred']:.1f}\n",
+                f"\n{'HEP Energy':<16s} : {hep_energy.value:.3f} {hep_energy.unit}\n",
+                f"{'HEP Probability':<16s} : {d['HEP_Prob']:.3f}\n",
+                f"{'Bayesian Blocks':<16s} : {d['Variability_BayesBlocks']}\n",
+                f"{'Redshift':<16s} : {d['Redshift']:.3f}\n",
+                f"{'NuPeak_obs':<16s} : {nupeak_obs.value:.3} {nupeak_obs.unit}\n",
+            ]
         )
 
-        return ss
-
+    @_cached_model
     def spectral_model(self):
         """Best fit spectral model as a `~gammapy.modeling.models.SpectralModel` object."""
         d = self.data
-        spec_type = self.data["SpectrumType"].strip()
+        spec_type = self._spec_type
 
-        if spec_type == "PowerLaw":
-            tag = "PowerLawSpectralModel"
-            pars = {
-                "reference": d["Pivot_Energy"],
-                "amplitude": d["Flux_Density"],
-                "index": d["PowerLaw_Index"],
-            }
-            errs = {
-                "amplitude": d["Unc_Flux_Density"],
-                "index": d["Unc_PowerLaw_Index"],
-            }
-        elif spec_type == "LogParabola":
-            tag = "LogParabolaSpectralModel"
-            pars = {
-                "reference": d["Pivot_Energy"],
-                "amplitude": d["Flux_Density"],
-                "alpha": d["Spectral_Index"],
-                "beta": d["beta"],
-            }
-            errs = {
-                "amplitude": d["Unc_Flux_Density"],
-                "alpha": d["Unc_Spectral_Index"],
-                "beta": d["Unc_beta"],
-            }
-        else:
+        try:
+            get_pars = _SPECTRAL_MODEL_PARS_3FHL[spec_type]
+        except KeyError:
             raise ValueError(f"Invalid spec_type: {spec_type!r}")
 
+        tag, pars, errs = get_pars(d)
+
         model = Model.create(tag, "spectral", **pars)
 
         for name, value in errs.items():
@@ -1285,41 +1792,24 @@ class SourceCatalogObject3FHL(SourceCatalogObjectFermiBase):
         return model
 
     @property
+    @_cached_table
     def flux_points_table(self):
         """Flux points as a `~astropy.table.Table`."""
-        table = Table()
-        table.meta.update(self.flux_points_meta)
-        table["e_min"] = self._energy_edges[:-1]
-        table["e_max"] = self._energy_edges[1:]
-
-        flux = self.data["Flux_Band"]
-        flux_err = self.data["Unc_Flux_Band"]
-        e2dnde = self.data["nuFnu"]
-
-        table["flux"] = flux
-        table["flux_errn"] = np.abs(flux_err[:, 0])
-        table["flux_errp"] = flux_err[:, 1]
-
-        table["e2dnde"] = e2dnde
-        table["e2dnde_errn"] = np.abs(e2dnde * flux_err[:, 0] / flux)
-        table["e2dnde_errp"] = e2dnde * flux_err[:, 1] / flux
-
-        is_ul = np.isnan(table["flux_errn"])
-        table["is_ul"] = is_ul
-
-        # handle upper limits
-        table["flux_ul"] = np.nan * flux_err.unit
-        flux_ul = compute_flux_points_ul(table["flux"], table["flux_errp"])
-        table["flux_ul"][is_ul] = flux_ul[is_ul]
-
-        table["e2dnde_ul"] = np.nan * e2dnde.unit
-        e2dnde_ul = compute_flux_points_ul(table["e2dnde"], table["e2dnde_errp"])
-        table["e2dnde_ul"][is_ul] = e2dnde_ul[is_ul]
+        columns = _flux_points_columns(
+            flux=self.data["Flux_Band"],
+            flux_err=self.data["Unc_Flux_Band"],
+            e2dnde=self.data["nuFnu"],
+        )
 
+        data = {"e_min": self._energy_min, "e_max": self._energy_max}
+        data.update(columns)
         # Square root of test statistic
-        table["sqrt_ts"] = self.data["Sqrt_TS_Band"]
+        data["sqrt_ts"] = self.data["Sqrt_TS_Band"]
+        table = Table(data)
+        table.meta.update(self.flux_points_meta)
         return table
 
+    @_cached_model
     def spatial_model(self):
         """Source spatial model as a `~gammapy.modeling.models.SpatialModel` object."""
         d = self.data
@@ -1331,26 +1821,12 @@ class SourceCatalogObject3FHL(SourceCatalogObjectFermiBase):
         else:
             de = self.data_extended
             morph_type = de["Spatial_Function"].strip()
-            e = (1 - (de["Model_SemiMinor"] / de["Model_SemiMajor"]) ** 2.0) ** 0.5
-            sigma = de["Model_SemiMajor"]
-            phi = de["Model_PosAng"]
-            if morph_type == "RadialDisk":
-                r_0 = de["Model_SemiMajor"]
-                model = DiskSpatialModel(
-                    lon_0=ra, lat_0=dec, r_0=r_0, e=e, phi=phi, frame="icrs"
-                )
-            elif morph_type in ["SpatialMap"]:
-                filename = de["Spatial_Filename"].strip()
-                path = make_path(
-                    "$GAMMAPY_DATA/catalogs/fermi/Extended_archive_v18/Templates/"
-                )
-                model = TemplateSpatialModel.read(path / filename)
-            elif morph_type == "RadialGauss":
-                model = GaussianSpatialModel(
-                    lon_0=ra, lat_0=dec, sigma=sigma, e=e, phi=phi, frame="icrs"
-                )
-            else:
+            try:
+                make_model = _SPATIAL_MODELS_3FHL[morph_type]
+            except KeyError:
                 raise ValueError(f"Invalid morph_type: {morph_type!r}")
+
+            model = make_model(ra, dec, de, self._eccentricity)
         self._set_spatial_errors(model)
         return model
 
@@ -1358,7 +1834,7 @@ class SourceCatalogObject3FHL(SourceCatalogObjectFermiBase):
 class SourceCatalogObject2PC(SourceCatalogObjectFermiPCBase):
     """One source from the 2PC catalog."""
 
-    @property
+    @lazyproperty
     def _auxiliary_filename(self):
         return make_path(
             f"$GAMMAPY_DATA/catalogs/fermi/2PC_auxiliary/PSR{self.name}_2PC_data.fits.gz"
@@ -1366,97 +1842,121 @@ class SourceCatalogObject2PC(SourceCatalogObjectFermiPCBase):
 
     def _info_more(self):
         d = self.data
-        ss = "\n*** Other info ***\n\n"
-        ss += "{:<20s} : {:s}\n".format("Binary", d["Binary"])
-        return ss
+        return f"\n*** Other info ***\n\n{'Binary':<20s} : {d['Binary']:s}\n"
 
     def _info_pulsar(self):
         d = self.data
-        ss = "\n*** Pulsar info ***\n\n"
-        ss += "{:<20s} : {:.3f}\n".format("Period", d["Period"])
-        ss += "{:<20s} : {:.3e}\n".format("P_Dot", d["P_Dot"])
-        ss += "{:<20s} : {:.3e}\n".format("E_Dot", d["E_Dot"])
-        ss += "{:<20s} : {}\n".format("Type", d["Type"])
-        return ss
+        return (
+            "\n*** Pulsar info ***\n\n"
+            f"{'Period':<20s} : {d['Period']:.3f}\n"
+            f"{'P_Dot':<20s} : {d['P_Dot']:.3e}\n"
+            f"{'E_Dot':<20s} : {d['E_Dot']:.3e}\n"
+            f"{'Type':<20s} : {d['Type']}\n"
+        )
 
     def _info_spectral_fit(self):
         d = self.data_spectral
-        ss = "\n*** Spectral info ***\n\n"
+        ss = ["\n*** Spectral info ***\n\n"]
         if d is None:
-            ss += "No spectral info available.\n"
-            return ss
-        ss += "{:<20s} : {}\n".format("On peak", d["On_Peak"])
-        ss += "{:<20s} : {:.0f}\n".format("TS DC", d["TS_DC"])
-        ss += "{:<20s} : {:.0f}\n".format("TS cutoff", d["TS_Cutoff"])
-        ss += "{:<20s} : {:.0f}\n".format("TS b free", d["TS_bfree"])
+            ss.append("No spectral info available.\n")
+            return "".join(ss)
+        ss.append(f"{'On peak':<20s} : {d['On_Peak']}\n")
+        ss.append(f"{'TS DC':<20s} : {d['TS_DC']:.0f}\n")
+        ss.append(f"{'TS cutoff':<20s} : {d['TS_Cutoff']:.0f}\n")
+        ss.append(f"{'TS b free':<20s} : {d['TS_bfree']:.0f}\n")
 
         indentation = " " * 4
         fmt_e = "{}{:<20s} : {:.3e} +- {:.3e}\n"
         fmt_f = "{}{:<20s} : {:.3f} +- {:.3f}\n"
-
-        if not isinstance(d["PLEC1_Prefactor"], np.ma.core.MaskedConstant):
-            ss += "\n{}* PLSuperExpCutoff b = 1 *\n\n".format(indentation)
-            ss += fmt_e.format(
-                indentation, "Amplitude", d["PLEC1_Prefactor"], d["Unc_PLEC1_Prefactor"]
-            )
-            ss += fmt_f.format(
-                indentation,
-                "Index 1",
-                d["PLEC1_Photon_Index"],
-                d["Unc_PLEC1_Photon_Index"],
+        fmt = indentation + "{:<20s} : {:.3f}\n"
+
+        if not np.ma.is_masked(d["PLEC1_Prefactor"]):
+            ss.append(f"\n{indentation}* PLSuperExpCutoff b = 1 *\n\n")
+            ss.append(
+                fmt_e.format(
+                    indentation,
+                    "Amplitude",
+                    d["PLEC1_Prefactor"],
+                    d["Unc_PLEC1_Prefactor"],
+                )
             )
-            ss += "{}{:<20s} : {:.3f}\n".format(indentation, "Index 2", 1)
-            ss += "{}{:<20s} : {:.3f}\n".format(
-                indentation, "Reference", d["PLEC1_Scale"]
+            ss.append(
+                fmt_f.format(
+                    indentation,
+                    "Index 1",
+                    d["PLEC1_Photon_Index"],
+                    d["Unc_PLEC1_Photon_Index"],
+                )
             )
-            ss += fmt_f.format(
-                indentation, "Ecut", d["PLEC1_Cutoff"], d["Unc_PLEC1_Cutoff"]
+            ss.append(fmt.format("Index 2", 1))
+            ss.append(fmt.format("Reference", d["PLEC1_Scale"]))
+            ss.append(
+                fmt_f.format(
+                    indentation, "Ecut", d["PLEC1_Cutoff"], d["Unc_PLEC1_Cutoff"]
+                )
             )
 
-        if not isinstance(d["PLEC_Prefactor"], np.ma.core.MaskedConstant):
-            ss += "\n{}* PLSuperExpCutoff b free *\n\n".format(indentation)
-            ss += fmt_e.format(
-                indentation, "Amplitude", d["PLEC_Prefactor"], d["Unc_PLEC_Prefactor"]
-            )
-            ss += fmt_f.format(
-                indentation,
-                "Index 1",
-                d["PLEC_Photon_Index"],
-                d["Unc_PLEC_Photon_Index"],
+        if not np.ma.is_masked(d["PLEC_Prefactor"]):
+            ss.append(f"\n{indentation}* PLSuperExpCutoff b free *\n\n")
+            ss.append(
+                fmt_e.format(
+                    indentation,
+                    "Amplitude",
+                    d["PLEC_Prefactor"],
+                    d["Unc_PLEC_Prefactor"],
+                )
             )
-            ss += fmt_f.format(
-                indentation,
-                "Index 2",
-                d["PLEC_Exponential_Index"],
-                d["Unc_PLEC_Exponential_Index"],
+            ss.append(
+                fmt_f.format(
+                    indentation,
+                    "Index 1",
+                    d["PLEC_Photon_Index"],
+                    d["Unc_PLEC_Photon_Index"],
+                )
             )
-
-            ss += "{}{:<20s} : {:.3f}\n".format(
-                indentation, "Reference", d["PLEC_Scale"]
+            ss.append(
+                fmt_f.format(
+                    indentation,
+                    "Index 2",
+                    d["PLEC_Exponential_Index"],
+                    d["Unc_PLEC_Exponential_Index"],
+                )
             )
-            ss += fmt_f.format(
-                indentation, "Ecut", d["PLEC_Cutoff"], d["Unc_PLEC_Cutoff"]
+            ss.append(fmt.format("Reference", d["PLEC_Scale"]))
+            ss.append(
+                fmt_f.format(
+                    indentation, "Ecut", d["PLEC_Cutoff"], d["Unc_PLEC_Cutoff"]
+                )
             )
 
-        if not isinstance(d["PL_Prefactor"], np.ma.core.MaskedConstant):
-            ss += "\n{}* PowerLaw *\n\n".format(indentation)
-            ss += fmt_e.format(
-                indentation, "Amplitude", d["PL_Prefactor"], d["Unc_PL_Prefactor"]
+        if not np.ma.is_masked(d["PL_Prefactor"]):
+            ss.append(f"\n{indentation}* PowerLaw *\n\n")
+            ss.append(
+                fmt_e.format(
+                    indentation, "Amplitude", d["PL_Prefactor"], d["Unc_PL_Prefactor"]
+                )
             )
-            ss += fmt_f.format(
-                indentation, "Index", d["PL_Photon_Index"], d["Unc_PL_Photon_Index"]
+            ss.append(
+                fmt_f.format(
+                    indentation,
+                    "Index",
+                    d["PL_Photon_Index"],
+                    d["Unc_PL_Photon_Index"],
+                )
             )
-            ss += "{}{:<20s} : {:.3f}\n".format(indentation, "Reference", d["PL_Scale"])
+            ss.append(fmt.format("Reference", d["PL_Scale"]))
 
-        return ss
+        return "".join(ss)
 
     def _info_phasogram(self):
         d = self.data
-        ss = "\n*** Phasogram info ***\n\n"
-        ss += "{:<20s} : {:d}\n".format("Number of peaks", d["Num_Peaks"])
-        ss += "{:<20s} : {:.3f}\n".format("Peak separation", d["Peak_Sep"])
-        return ss
+        return (
+            "\n*** Phasogram info ***\n\n"
+            f"{'Number of peaks':<20s} : {d['Num_Peaks']:d}\n"
+            f"{'Peak separation':<20s} : {d['Peak_Sep']:.3f}\n"
+        )
 
+    @_cached_model
     def spectral_model(self):
         d = self.data_spectral
         if d is None:
@@ -1514,40 +2014,37 @@ class SourceCatalogObject2PC(SourceCatalogObjectFermiPCBase):
         return model
 
     @property
+    @_cached_table
     def flux_points_table(self):
         """Flux points (`~astropy.table.Table`)."""
 
         try:
-            with warnings.catch_warnings():
-                warnings.simplefilter("ignore", u.UnitsWarning)
-                fp_data = Table.read(self._auxiliary_filename, hdu="PULSAR_SED")
+            fp_data = _read_auxiliary_table(self._auxiliary_filename, "PULSAR_SED")
         except (KeyError, FileNotFoundError):
             log.warning(f"No flux points available for source {self.name}")
             return None
-        table = Table()
-
-        table["e_min"] = fp_data["Energy_Min"]
-        table["e_max"] = fp_data["Energy_Max"]
-        table["e_ref"] = fp_data["Center_Energy"]
-
-        table["flux"] = fp_data["PhotonFlux"]
-        table["flux_err"] = fp_data["Unc_PhotonFlux"]
-
-        table["e2dnde"] = fp_data["EnergyFlux"]
-        table["e2dnde_err"] = fp_data["Unc_EnergyFlux"]
 
-        is_ul = np.where(table["e2dnde_err"] == 0, True, False)
-        table["is_ul"] = is_ul
+        columns = fp_data.columns
+        data = {
+            "e_min": columns["Energy_Min"],
+            "e_max": columns["Energy_Max"],
+            "e_ref": columns["Center_Energy"],
+            "flux": columns["PhotonFlux"],
+            "flux_err": columns["Unc_PhotonFlux"],
+            "e2dnde": columns["EnergyFlux"],
+            "e2dnde_err": columns["Unc_EnergyFlux"],
+        }
 
-        table["flux_ul"] = np.nan * table["flux_err"].unit
-        flux_ul = compute_flux_points_ul(table["flux"], table["flux_err"])
-        table["flux_ul"][is_ul] = flux_ul[is_ul]
+        is_ul = np.asarray(data["e2dnde_err"] == 0)
+        data["is_ul"] = is_ul
 
-        table["e2dnde_ul"] = np.nan * table["e2dnde"].unit
-        e2dnde_ul = compute_flux_points_ul(table["e2dnde"], table["e2dnde_err"])
-        table["e2dnde_ul"][is_ul] = e2dnde_ul[is_ul]
+        for name in ["flux", "e2dnde"]:
+            value, err = data[name].quantity, data[f"{name}_err"].quantity
+            ul = np.full(value.shape, np.nan) << value.unit
+            ul[is_ul] = compute_flux_points_ul(value[is_ul], err[is_ul])
+            data[f"{name}_ul"] = ul
 
-        return table
+        return Table(data)
 
 
 class SourceCatalogObject3PC(SourceCatalogObjectFermiPCBase):
@@ -1556,6 +2053,9 @@ class SourceCatalogObject3PC(SourceCatalogObjectFermiPCBase):
     asso = ["assoc_new"]
 
     _energy_edges = u.Quantity([50, 100, 300, 1_000, 3e3, 1e4, 3e4, 1e5, 1e6], "MeV")
+    _energy_min = _energy_edges[:-1]
+    _energy_max = _energy_edges[1:]
+    _energy_ref = np.sqrt(_energy_min * _energy_max)
 
     _pulse_profile_column_name = [
         "GT100_WtCnt",
@@ -1566,8 +2066,11 @@ class SourceCatalogObject3PC(SourceCatalogObjectFermiPCBase):
         "3000_100000_WtCt",
         "10000_100000_WtCt",
     ]
+    _pulse_profile_names = _pulse_profile_column_name + [
+        f"Unc_{_}" for _ in _pulse_profile_column_name
+    ]
 
-    @property
+    @lazyproperty
     def _auxiliary_filename(self):
         return make_path(
             f"$GAMMAPY_DATA/catalogs/fermi/3PC_auxiliary_20230728/{self.name}_3PC_data.fits.gz"
@@ -1575,102 +2078,116 @@ class SourceCatalogObject3PC(SourceCatalogObjectFermiPCBase):
 
     def _info_pulsar(self):
         d = self.data
-        ss = "\n*** Pulsar info ***\n\n"
-        ss += "{:<20s} : {:.3f}\n".format("Period", d["P0"])
-        ss += "{:<20s} : {:.3e}\n".format("P_Dot", d["P1"])
-        ss += "{:<20s} : {:.3e}\n".format("E_Dot", d["EDOT"])
-        return ss
+        ss = ["\n*** Pulsar info ***\n\n"]
+        ss.append(f"{'Period':<20s} : {d['P0']:.3f}\n")
+        ss.append(f"{'P_Dot':<20s} : {d['P1']:.3e}\n")
+        ss.append(f"{'E_Dot':<20s} : {d['EDOT']:.3e}\n")
+        return "".join(ss)
 
     def _info_phasogram(self):
         d = self.data
-        ss = "\n*** Phasogram info ***\n\n"
-        if not isinstance(d["NPEAK"], np.ma.core.MaskedConstant):
-            npeak = d["NPEAK"]
-            ss += "{:<20s} : {:.3f}\n".format("Number of peaks", npeak)
+        ss = ["\n*** Phasogram info ***\n\n"]
+        npeak = d["NPEAK"]
+        if not np.ma.is_masked(npeak):
+            ss.append(f"{'Number of peaks':<20s} : {npeak:.3f}\n")
             if npeak > 1:
-                ss += "{:<20s} : {:.3f}\n".format("Ph1 (peak one)", d["PHI1"])
-                ss += "{:<20s} : {:.3f}\n".format(
-                    "Ph2 (peak two)", d["PHI1"] + d["PKSEP"]
-                )
-                ss += "{:<20s} : {:.3f}\n".format("Peak separation", d["PKSEP"])
+                ss.append(f"{'Ph1 (peak one)':<20s} : {d['PHI1']:.3f}\n")
+                ss.append(f"{'Ph2 (peak two)':<20s} : {d['PHI1'] + d['PKSEP']:.3f}\n")
+                ss.append(f"{'Peak separation':<20s} : {d['PKSEP']:.3f}\n")
             else:
-                if not isinstance(d["PHI1"], np.ma.core.MaskedConstant):
-                    ss += "{:<20s} : {:.3f}\n".format("Ph1 (peak one)", d["PHI1"])
+                if not np.ma.is_masked(d["PHI1"]):
+                    ss.append(f"{'Ph1 (peak one)':<20s} : {d['PHI1']:.3f}\n")
         else:
-            ss += "No phasogram info available.\n"
-        return ss
+            ss.append("No phasogram info available.\n")
+        return "".join(ss)
 
     def _info_spectral_fit(self):
         d = self.data_spectral
-        ss = "\n*** Spectral info ***\n\n"
+        ss = ["\n*** Spectral info ***\n\n"]
         if d is None:
-            ss += "No spectral info available.\n"
-            return ss
-        ss += "{:<20s} : {:.0f}\n".format("TS", d["Test_Statistic"])
-        ss += "{:<20s} : {:.0f}\n".format("Significance (DC)", d["Signif_Avg"])
-        ss += "{:<20s} : {:s}\n".format("Spectrum Type", d["SpectrumType"])
+            ss.append("No spectral info available.\n")
+            return "".join(ss)
+        ss.append(f"{'TS':<20s} : {d['Test_Statistic']:.0f}\n")
+        ss.append(f"{'Significance (DC)':<20s} : {d['Signif_Avg']:.0f}\n")
+        ss.append(f"{'Spectrum Type':<20s} : {d['SpectrumType']:s}\n")
 
         indentation = " " * 4
         fmt_e = "{}{:<20s} : {:.3e} +- {:.3e}\n"
         fmt_f = "{}{:<20s} : {:.3f} +- {:.3f}\n"
 
-        if not isinstance(d["PLEC_Flux_Density_b23"], np.ma.core.MaskedConstant):
-            ss += "\n{}* SuperExpCutoffPowerLaw4FGLDR3 b = 2/3 *\n\n".format(
-                indentation
-            )
-            ss += fmt_e.format(
-                indentation,
-                "Amplitude",
-                d["PLEC_Flux_Density_b23"],
-                d["Unc_PLEC_Flux_Density_b23"],
+        if not np.ma.is_masked(d["PLEC_Flux_Density_b23"]):
+            ss.append(f"\n{indentation}* SuperExpCutoffPowerLaw4FGLDR3 b = 2/3 *\n\n")
+            ss.append(
+                fmt_e.format(
+                    indentation,
+                    "Amplitude",
+                    d["PLEC_Flux_Density_b23"],
+                    d["Unc_PLEC_Flux_Density_b23"],
+                )
             )
-            ss += fmt_f.format(
-                indentation,
-                "Index 1",
-                -d["PLEC_IndexS_b23"],
-                d["Unc_PLEC_IndexS_b23"],
+            ss.append(
+                fmt_f.format(
+                    indentation,
+                    "Index 1",
+                    -d["PLEC_IndexS_b23"],
+                    d["Unc_PLEC_IndexS_b23"],
+                )
             )
-            ss += "{}{:<20s} : {:.3f}\n".format(indentation, "Index 2", 0.6667)
-            ss += "{}{:<20s} : {:.3f}\n".format(
-                indentation, "Reference", d["Pivot_Energy_b23"]
+            ss.append("{}{:<20s} : {:.3f}\n".format(indentation, "Index 2", 0.6667))
+            ss.append(
+                "{}{:<20s} : {:.3f}\n".format(
+                    indentation, "Reference", d["Pivot_Energy_b23"]
+                )
             )
-            ss += fmt_f.format(
-                indentation,
-                "Expfactor",
-                d["PLEC_ExpfactorS_b23"],
-                d["Unc_PLEC_ExpfactorS_b23"],
+            ss.append(
+                fmt_f.format(
+                    indentation,
+                    "Expfactor",
+                    d["PLEC_ExpfactorS_b23"],
+                    d["Unc_PLEC_ExpfactorS_b23"],
+                )
             )
 
-        if not isinstance(d["PLEC_Flux_Density_bfr"], np.ma.core.MaskedConstant):
-            ss += "\n{}* SuperExpCutoffPowerLaw4FGLDR3 b free *\n\n".format(indentation)
-            ss += fmt_e.format(
-                indentation,
-                "Amplitude",
-                d["PLEC_Flux_Density_bfr"],
-                d["Unc_PLEC_Flux_Density_bfr"],
+        if not np.ma.is_masked(d["PLEC_Flux_Density_bfr"]):
+            ss.append(f"\n{indentation}* SuperExpCutoffPowerLaw4FGLDR3 b free *\n\n")
+            ss.append(
+                fmt_e.format(
+                    indentation,
+                    "Amplitude",
+                    d["PLEC_Flux_Density_bfr"],
+                    d["Unc_PLEC_Flux_Density_bfr"],
+                )
             )
-            ss += fmt_f.format(
-                indentation,
-                "Index 1",
-                -d["PLEC_IndexS_bfr"],
-                d["Unc_PLEC_IndexS_bfr"],
+            ss.append(
+                fmt_f.format(
+                    indentation,
+                    "Index 1",
+                    -d["PLEC_IndexS_bfr"],
+                    d["Unc_PLEC_IndexS_bfr"],
+                )
             )
-            ss += fmt_f.format(
-                indentation,
-                "Index 2",
-                d["PLEC_Exp_Index_bfr"],
-                d["Unc_PLEC_Exp_Index_bfr"],
+            ss.append(
+                fmt_f.format(
+                    indentation,
+                    "Index 2",
+                    d["PLEC_Exp_Index_bfr"],
+                    d["Unc_PLEC_Exp_Index_bfr"],
+                )
             )
-            ss += "{}{:<20s} : {:.3f}\n".format(
-                indentation, "Reference", d["Pivot_Energy_bfr"]
+            ss.append(
+                "{}{:<20s} : {:.3f}\n".format(
+                    indentation, "Reference", d["Pivot_Energy_bfr"]
+                )
             )
-            ss += fmt_f.format(
-                indentation,
-                "Expfactor",
-                d["PLEC_ExpfactorS_bfr"],
-                d["Unc_PLEC_ExpfactorS_bfr"],
+            ss.append(
+                fmt_f.format(
+                    indentation,
+                    "Expfactor",
+                    d["PLEC_ExpfactorS_bfr"],
+                    d["Unc_PLEC_ExpfactorS_bfr"],
+                )
             )
-        return ss
+        return "".join(ss)
 
     @property
     def pulse_profile_best_fit(self):
@@ -1682,12 +2199,12 @@ class SourceCatalogObject3PC(SourceCatalogObjectFermiPCBase):
         best_fit_profile: `~gammapy.maps.RegionNDMap`
             Map containing the best fit.
         """
-        table = Table.read(self._auxiliary_filename, hdu="BEST_FIT_LC")
+        table = _read_auxiliary_table(self._auxiliary_filename, "BEST_FIT_LC")
 
         # For best-fit profile, Ph_min and Ph_max are equal and represent bin centers.
         phases = MapAxis.from_nodes(table["Ph_Min"], name="phase", interp="lin")
         best_fit_profile = RegionNDMap.create(
-            region=None, axes=[phases], data=table["Intensity"]
+            region=None, axes=[phases], data=np.asarray(table["Intensity"])
         )
         return best_fit_profile
 
@@ -1702,11 +2219,12 @@ class SourceCatalogObject3PC(SourceCatalogObjectFermiPCBase):
         radio_profile: `~gammapy.maps.RegionNDMap`
             Map containing the radio profile.
         """
-        table = Table.read(self._auxiliary_filename, hdu="RADIO_PROFILE")
+        table = _read_auxiliary_table(self._auxiliary_filename, "RADIO_PROFILE")
 
         # Need to do this because some PSR (J0540-6919) has duplicates
-        ph_node, unique_idx = np.unique(table["Ph_Min"], return_index=True)
-        data = table["Norm_Intensity"][unique_idx]
+        unique_sorted = get_fermi_kernels()["unique_sorted"]
+        ph_node, unique_idx = unique_sorted(np.asarray(table["Ph_Min"]))
+        data = np.asarray(table["Norm_Intensity"])[unique_idx]
 
         # For radio pulse profile, Ph_min and Ph_max are equal and represent bin centers.
         phases = MapAxis.from_nodes(ph_node, name="phase", interp="lin")
@@ -1738,26 +2256,27 @@ class SourceCatalogObject3PC(SourceCatalogObjectFermiPCBase):
             Maps containing the pulse profile in the different energy bin.
         """
 
-        table = Table.read(self._auxiliary_filename, hdu="GAMMA_LC")
+        table = _read_auxiliary_table(self._auxiliary_filename, "GAMMA_LC")
+        bin_edges = get_fermi_kernels()["bin_edges"]
         phases = MapAxis.from_edges(
-            np.unique(np.concatenate([table["Ph_Min"], table["Ph_Max"]])),
+            bin_edges(np.asarray(table["Ph_Min"]), np.asarray(table["Ph_Max"])),
             name="phase",
             interp="lin",
         )
         geom = RegionGeom(region=None, axes=[phases])
-        names = np.concatenate(
-            [
-                self._pulse_profile_column_name,
-                [f"Unc_{name}" for name in self._pulse_profile_column_name],
-            ]
-        )
+        names = self._pulse_profile_names
+        # one contiguous block for all profiles, each map gets a view of it
+        columns = table.columns
+        data = np.stack([np.asarray(columns[name]) for name in names])
+        data = data.reshape((len(names),) + geom.data_shape)
         maps = Maps.from_geom(
             geom=geom,
             names=names,
-            kwargs_list=[{"data": table[name].data} for name in names],
+            kwargs_list=[{"data": _} for _ in data],
         )
         return maps
 
+    @_cached_model
     def spectral_model(self, fit="auto"):
         """
         In the 3PC, Fermi-LAT collaboration tried to fit a
@@ -1779,10 +2298,13 @@ class SourceCatalogObject3PC(SourceCatalogObjectFermiPCBase):
             log.warning(f"No spectral model available for source {self.name}")
             return None
 
+        has_bfree = d.get("has_bfree")
+
+        if has_bfree is None:
+            has_bfree = not np.ma.is_masked(d["PLEC_IndexS_bfr"])
+
         tag = "SuperExpCutoffPowerLaw4FGLDR3SpectralModel"
-        if not (
-            isinstance(d["PLEC_IndexS_bfr"], np.ma.core.masked_array) or (fit == "b 23")
-        ):
+        if has_bfree and fit != "b 23":
             pars = {
                 "reference": d["Pivot_Energy_bfr"],
                 "amplitude": d["PLEC_Flux_Density_bfr"],
@@ -1818,6 +2340,7 @@ class SourceCatalogObject3PC(SourceCatalogObjectFermiPCBase):
         return model
 
     @property
+    @_cached_table
     def flux_points_table(self):
         """Flux points (`~astropy.table.Table`). Flux point is an upper limit if
         its significance is less than 2."""
@@ -1825,40 +2348,97 @@ class SourceCatalogObject3PC(SourceCatalogObjectFermiPCBase):
         if fp_data is None:
             log.warning(f"No flux points available for source {self.name}")
             return None
-        table = Table()
-
-        table["e_min"] = self._energy_edges[:-1]
-        table["e_max"] = self._energy_edges[1:]
-        table["e_ref"] = np.sqrt(table["e_min"] * table["e_max"])
 
         fgl_cols = ["Flux_Band", "Unc_Flux_Band", "Sqrt_TS_Band", "nuFnu_Band"]
         flux, flux_err, sig, nuFnu = [fp_data[col] for col in fgl_cols]
 
-        table["flux"] = flux
-        table["flux_errn"] = np.abs(flux_err[:, 0])
-        table["flux_errp"] = flux_err[:, 1]
+        columns = _flux_points_columns(
+            flux=flux, flux_err=flux_err, e2dnde=nuFnu, sqrt_ts=sig
+        )
+
+        data = {
+            "e_min": self._energy_min,
+            "e_max": self._energy_max,
+            "e_ref": self._energy_ref,
+        }
+        data.update(columns)
+        data["sqrt_ts"] = sig
+        return Table(data)
+
 
-        table["e2dnde"] = nuFnu
-        table["e2dnde_errn"] = np.abs(nuFnu * flux_err[:, 0] / flux)
-        table["e2dnde_errp"] = nuFnu * flux_err[:, 1] / flux
+class SourceCatalogFermiBase(SourceCatalog, abc.ABC):
+    """Base class for the Fermi-LAT source catalogs.
 
-        is_ul = np.isnan(flux_err[:, 0]) | (sig < 2)
-        table["is_ul"] = is_ul
+    Columns derived from the whole table are computed once and passed on to
+    the source objects.
+    """
 
-        table["flux_ul"] = np.nan * flux_err.unit
-        flux_ul = compute_flux_points_ul(table["flux"], table["flux_errp"])
-        table["flux_ul"][is_ul] = flux_ul[is_ul]
+    def _table_columns(self, name, func, table=None):
+        """Get derived columns, computing them with ``func(table)`` if needed.
 
-        table["e2dnde_ul"] = np.nan * table["e2dnde"].unit
-        e2dnde_ul = compute_flux_points_ul(table["e2dnde"], table["e2dnde_errp"])
-        table["e2dnde_ul"][is_ul] = e2dnde_ul[is_ul]
+        By default the columns are derived from the main catalog table.
+        """
+        cache = self.__dict__.setdefault("_table_columns_cache", {})
 
-        table["sqrt_ts"] = fp_data["Sqrt_TS_Band"]
+        if table is None:
+            table = self.table
 
-        return table
+        # the cache is invalid for a catalog created by boolean indexing,
+        # which copies the catalog and replaces the table
+        if name not in cache or cache[name][0] is not table:
+            cache[name] = table, func(table)
+
+        return cache[name][1]
+
+    def _make_source_object(self, index):
+        source = super()._make_source_object(index)
+
+        columns = self._table_columns(
+            "info_basic",
+            lambda table: _info_basic_columns(table, self.source_object_class.asso),
+        )
+
+        if columns is not None:
+            source.data["info_basic"] = {
+                name: values[index] for name, values in columns.items()
+            }
+
+        spec_types = self._table_columns("spec_type", _spec_types)
+
+        if spec_types is not None:
+            source.data["spec_type"] = spec_types[index]
+
+        is_pointlike = self._table_columns("is_pointlike", self._is_pointlike)
+
+        if is_pointlike is not None:
+            source.data["is_pointlike"] = bool(is_pointlike[index])
+
+        data_extended = getattr(source, "data_extended", None)
+
+        if data_extended is not None:
+            table = self.extended_sources_table
+            eccentricity = self._table_columns(
+                "eccentricity", _eccentricity, table=table
+            )
+            name = data_extended[self._source_name_key].strip()
+            idx = self._lookup_additional_table(table[self._source_name_key])[name]
+            data_extended["eccentricity"] = eccentricity[idx]
+
+        return source
+
+    @staticmethod
+    def _is_pointlike(table):
+        """Point-like flag of all sources, None if it can't be computed."""
+        try:
+            names = _column_to_list(table["Extended_Source_Name"])
+        except KeyError:
+            return None
 
+        names = np.char.strip(np.asarray(names, dtype=str))
+        return (names == "") | (names == "--")
 
-class SourceCatalog3FGL(SourceCatalog):
+
+class SourceCatalog3FGL(SourceCatalogFermiBase):
     """Fermi-LAT 3FGL source catalog.
 
     - https://ui.adsabs.harvard.edu/abs/2015ApJS..218...23A
@@ -1872,12 +2452,9 @@ class SourceCatalog3FGL(SourceCatalog):
     source_object_class = SourceCatalogObject3FGL
 
     def __init__(self, filename="$GAMMAPY_DATA/catalogs/fermi/gll_psc_v16.fit.gz"):
-        filename = make_path(filename)
-
-        with warnings.catch_warnings():  # ignore FITS units warnings
-            warnings.simplefilter("ignore", u.UnitsWarning)
-            table = Table.read(filename, hdu="LAT_Point_Source_Catalog")
-
+        table, extended_sources_table, hist_table = _read_catalog_tables(
+            filename, ["LAT_Point_Source_Catalog", "ExtendedSources", "Hist_Start"]
+        )
         table_standardise_units_inplace(table)
 
         source_name_key = "Source_Name"
@@ -1897,11 +2474,20 @@ class SourceCatalog3FGL(SourceCatalog):
             source_name_alias=source_name_alias,
         )
 
-        self.extended_sources_table = Table.read(filename, hdu="ExtendedSources")
-        self.hist_table = Table.read(filename, hdu="Hist_Start")
+        self.extended_sources_table = extended_sources_table
+        self.hist_table = hist_table
+
+    def _make_source_object(self, index):
+        source = super()._make_source_object(index)
+        names = self.source_object_class._band_columns["Sqrt_TS"]
+        sqrt_ts = self._table_columns(
+            "sqrt_ts", lambda table: _band_values(table, names)
+        )
+        source.data["sqrt_ts"] = sqrt_ts[index]
+        return source
 
 
-class SourceCatalog4FGL(SourceCatalog):
+class SourceCatalog4FGL(SourceCatalogFermiBase):
     """Fermi-LAT 4FGL source catalog.
 
     - https://arxiv.org/abs/1902.10045 (DR1)
@@ -1920,8 +2506,26 @@ class SourceCatalog4FGL(SourceCatalog):
     source_object_class = SourceCatalogObject4FGL
 
     def __init__(self, filename="$GAMMAPY_DATA/catalogs/fermi/gll_psc_v32.fit.gz"):
-        filename = make_path(filename)
-        table = Table.read(filename, hdu="LAT_Point_Source_Catalog")
+        (
+            table,
+            extended_sources_table,
+            hist_table,
+            hist2_table,
+            gti_meta,
+            energy_bounds_table,
+        ) = _read_catalog_tables(
+            filename,
+            [
+                "LAT_Point_Source_Catalog",
+                "ExtendedSources",
+                "Hist_Start",
+                "Hist2_Start",
+                "GTI",
+                "EnergyBounds",
+            ],
+            optional=["Hist_Start", "Hist2_Start", "GTI"],
+            meta=["GTI"],
+        )
         table_standardise_units_inplace(table)
 
         source_name_key = "Source_Name"
@@ -1942,30 +2546,65 @@ class SourceCatalog4FGL(SourceCatalog):
             source_name_alias=source_name_alias,
         )
 
-        self.extended_sources_table = Table.read(filename, hdu="ExtendedSources")
+        self.extended_sources_table = extended_sources_table
         self.extended_sources_table["version"] = int(
-            "".join(filter(str.isdigit, table.meta["VERSION"]))
+            re.sub(r"\D", "", table.meta["VERSION"])
         )
-        try:
-            self.hist_table = Table.read(filename, hdu="Hist_Start")
-            if "MJDREFI" not in self.hist_table.meta:
-                self.hist_table.meta = Table.read(filename, hdu="GTI").meta
-        except KeyError:
-            pass
-        try:
-            self.hist2_table = Table.read(filename, hdu="Hist2_Start")
-            if "MJDREFI" not in self.hist_table.meta:
-                self.hist2_table.meta = Table.read(filename, hdu="GTI").meta
-        except KeyError:
-            pass
 
-        table = Table.read(filename, hdu="EnergyBounds")
-        self.flux_points_energy_edges = np.unique(
-            np.c_[table["LowerEnergy"].quantity, table["UpperEnergy"].quantity]
+        if hist_table is not None:
+            self.hist_table = hist_table
+            if "MJDREFI" not in hist_table.meta and gti_meta is not None:
+                hist_table.meta = gti_meta
+        if hist2_table is not None:
+            self.hist2_table = hist2_table
+            if "MJDREFI" not in self.hist_table.meta and gti_meta is not None:
+                hist2_table.meta = gti_meta.copy()
+
+        energy_min = energy_bounds_table["LowerEnergy"].quantity
+        energy_max = energy_bounds_table["UpperEnergy"].quantity
+        bin_edges = get_fermi_kernels()["bin_edges"]
+        self.flux_points_energy_edges = u.Quantity(
+            bin_edges(energy_min.value, energy_max.to_value(energy_min.unit)),
+            energy_min.unit,
+            copy=COPY_IF_NEEDED,
         )
 
+    def preload_templates(self, n_jobs=None):
+        """Read the spatial templates of all extended sources in parallel.
+
+        The templates are cached, so the `spatial_model` of the extended
+        sources no longer needs to read them from disk.
+
+        Parameters
+        ----------
+        n_jobs : int, optional
+            Number of threads. Default is None, which uses the
+            `~concurrent.futures.ThreadPoolExecutor` default.
+        """
+        table = self.extended_sources_table
+        model_form = np.char.strip(np.asarray(table["Model_Form"], dtype=str))
+        is_template = np.isin(model_form, ["Map", "Ring", "2D Gaussian x2"])
+
+        filenames = {
+            str(_template_path_4fgl(row["Spatial_Filename"], row["version"]))
+            for row in table[is_template]
+        }
+
+        with warnings.catch_warnings():  # ignore FITS units warnings
+            warnings.simplefilter("ignore", FITSFixedWarning)
+            with ThreadPoolExecutor(max_workers=n_jobs) as executor:
+                list(executor.map(_read_template_map, filenames))
+
+    def _make_source_object(self, index):
+        source = super()._make_source_object(index)
+        columns = self._table_columns("fp_columns", _flux_points_columns_table)
+        source.data["fp_columns"] = {
+            name: values[index] for name, values in columns.items()
+        }
+        return source
+
 
-class SourceCatalog2FHL(SourceCatalog):
+class SourceCatalog2FHL(SourceCatalogFermiBase):
     """Fermi-LAT 2FHL source catalog.
 
     - https://ui.adsabs.harvard.edu/abs/2016ApJS..222....5A
@@ -1979,12 +2618,9 @@ class SourceCatalog2FHL(SourceCatalog):
     source_object_class = SourceCatalogObject2FHL
 
     def __init__(self, filename="$GAMMAPY_DATA/catalogs/fermi/gll_psch_v09.fit.gz"):
-        filename = make_path(filename)
-
-        with warnings.catch_warnings():  # ignore FITS units warnings
-            warnings.simplefilter("ignore", u.UnitsWarning)
-            table = Table.read(filename, hdu="2FHL Source Catalog")
-
+        table, extended_sources_table, rois = _read_catalog_tables(
+            filename, ["2FHL Source Catalog", "Extended Sources", "ROIs"]
+        )
         table_standardise_units_inplace(table)
 
         source_name_key = "Source_Name"
@@ -1995,11 +2631,16 @@ class SourceCatalog2FHL(SourceCatalog):
             source_name_alias=source_name_alias,
         )
 
-        self.extended_sources_table = Table.read(filename, hdu="Extended Sources")
-        self.rois = Table.read(filename, hdu="ROIs")
+        self.extended_sources_table = extended_sources_table
+        self.rois = rois
 
+    @staticmethod
+    def _is_pointlike(table):
+        names = np.char.strip(np.asarray(table["Source_Name"], dtype=str))
+        return ~np.char.endswith(names, "e")
 
-class SourceCatalog3FHL(SourceCatalog):
+
+class SourceCatalog3FHL(SourceCatalogFermiBase):
     """Fermi-LAT 3FHL source catalog.
 
     - https://ui.adsabs.harvard.edu/abs/2017ApJS..232...18A
@@ -2013,12 +2654,10 @@ class SourceCatalog3FHL(SourceCatalog):
     source_object_class = SourceCatalogObject3FHL
 
     def __init__(self, filename="$GAMMAPY_DATA/catalogs/fermi/gll_psch_v13.fit.gz"):
-        filename = make_path(filename)
-
-        with warnings.catch_warnings():  # ignore FITS units warnings
-            warnings.simplefilter("ignore", u.UnitsWarning)
-            table = Table.read(filename, hdu="LAT_Point_Source_Catalog")
-
+        table, extended_sources_table, rois, energy_bounds_table = _read_catalog_tables(
+            filename,
+            ["LAT_Point_Source_Catalog", "ExtendedSources", "ROIs", "EnergyBounds"],
+        )
         table_standardise_units_inplace(table)
 
         source_name_key = "Source_Name"
@@ -2029,9 +2668,9 @@ class SourceCatalog3FHL(SourceCatalog):
             source_name_alias=source_name_alias,
         )
 
-        self.extended_sources_table = Table.read(filename, hdu="ExtendedSources")
-        self.rois = Table.read(filename, hdu="ROIs")
-        self.energy_bounds_table = Table.read(filename, hdu="EnergyBounds")
+        self.extended_sources_table = extended_sources_table
+        self.rois = rois
+        self.energy_bounds_table = energy_bounds_table
 
 
 class SourceCatalog2PC(SourceCatalog):
@@ -2048,17 +2687,14 @@ class SourceCatalog2PC(SourceCatalog):
     source_object_class = SourceCatalogObject2PC
 
     def __init__(self, filename="$GAMMAPY_DATA/catalogs/fermi/2PC_catalog_v04.fits.gz"):
-        filename = make_path(filename)
+        tables = _read_catalog_tables(
+            filename, ["PULSAR_CATALOG", "SPECTRAL", "OFF_PEAK"]
+        )
 
-        with warnings.catch_warnings():
-            warnings.simplefilter("ignore", u.UnitsWarning)
-            table_psr = Table.read(filename, hdu="PULSAR_CATALOG")
-            table_spectral = Table.read(filename, hdu="SPECTRAL")
-            table_off_peak = Table.read(filename, hdu="OFF_PEAK")
+        for table in tables:
+            table_standardise_units_inplace(table)
 
-        table_standardise_units_inplace(table_psr)
-        table_standardise_units_inplace(table_spectral)
-        table_standardise_units_inplace(table_off_peak)
+        table_psr, table_spectral, table_off_peak = tables
 
         source_name_key = "PSR_Name"
 
@@ -2069,13 +2705,19 @@ class SourceCatalog2PC(SourceCatalog):
         self.off_peak_table = table_off_peak
         self.spectral_table = table_spectral
 
-    def to_models(self, **kwargs):
-        models = Models()
-        for m in self:
-            sky_model = m.sky_model()
-            if sky_model is not None:
-                models.append(sky_model)
-        return models
+    def to_models(self, n_jobs=None, **kwargs):
+        """Create Models object from catalog.
+
+        Sources without a spectral model are skipped.
+
+        Parameters
+        ----------
+        n_jobs : int, optional
+            Number of threads used to create the sky models. Default is None,
+            which is one unless `~gammapy.utils.parallel.N_JOBS_DEFAULT` was
+            modified.
+        """
+        return _pulsar_models(self, n_jobs=n_jobs)
 
     def _get_name_spectral(self, data):
         return f"{data[self._source_name_key].strip()}"
@@ -2097,17 +2739,15 @@ class SourceCatalog3PC(SourceCatalog):
     def __init__(
         self, filename="$GAMMAPY_DATA/catalogs/fermi/3PC_Catalog+SEDs_20230803.fits.gz"
     ):
-        filename = make_path(filename)
+        tables = _read_catalog_tables(
+            filename,
+            ["PULSARS_BIGFILE", "LAT_Point_Source_Catalog", "BIGFILE_CONFIG"],
+        )
 
-        with warnings.catch_warnings():
-            warnings.simplefilter("ignore", u.UnitsWarning)
-            table_psr = Table.read(filename, hdu="PULSARS_BIGFILE")
-            table_spectral = Table.read(filename, hdu="LAT_Point_Source_Catalog")
-            table_bigfile_config = Table.read(filename, hdu="BIGFILE_CONFIG")
+        for table in tables:
+            table_standardise_units_inplace(table)
 
-        table_standardise_units_inplace(table_psr)
-        table_standardise_units_inplace(table_spectral)
-        table_standardise_units_inplace(table_bigfile_config)
+        table_psr, table_spectral, table_bigfile_config = tables
 
         source_name_key = "PSRJ"
         super().__init__(table=table_psr, source_name_key=source_name_key)
@@ -2117,17 +2757,42 @@ class SourceCatalog3PC(SourceCatalog):
         self.spectral_table = table_spectral
         self.off_bigfile_config = table_bigfile_config
 
-    def to_models(self, **kwargs):
-        models = Models()
-        for m in self:
-            sky_model = m.sky_model()
-            if sky_model is not None:
-                models.append(sky_model)
-        return models
+    def to_models(self, n_jobs=None, **kwargs):
+        """Create Models object from catalog.
+
+        Sources without a spectral model are skipped.
+
+        Parameters
+        ----------
+        n_jobs : int, optional
+            Number of threads used to create the sky models. Default is None,
+            which is one unless `~gammapy.utils.parallel.N_JOBS_DEFAULT` was
+            modified.
+        """
+        return _pulsar_models(self, n_jobs=n_jobs)
 
     @property
     def _get_source_name_key(self):
         return "NickName"
 
+    def _make_source_object(self, index):
+        source = super()._make_source_object(index)
+
+        if source.data_spectral is not None:
+            table = self.spectral_table
+            cache = self.__dict__.get("_has_bfree_cache", (None, None))
+
+            # the "b free" fit is available where its index is not masked
+            if cache[0] is not table:
+                has_bfree = ~np.ma.getmaskarray(table["PLEC_IndexS_bfr"])
+                cache = self.__dict__["_has_bfree_cache"] = table, has_bfree
+
+            idx = self._lookup_additional_table(table[self._get_source_name_key])[
+                self._get_name_spectral(source.data)
+            ]
+            source.data_spectral["has_bfree"] = bool(cache[1][idx])
+
+        return source
+
     def _get_name_spectral(self, data):
         return f"PSR{data[self._source_name_key].strip()}"
@@ -2,7 +2,7 @@
 import pytest
 import numpy as np
 from numpy.testing import assert_allclose
-from astropy.table import Column, Table
+from astropy.table import Column, MaskedColumn, Table
 from astropy.units import Quantity
 from gammapy.catalog import SourceCatalog
 from gammapy.utils.testing import assert_quantity_allclose
@@ -42,6 +42,15 @@ class TestSourceCatalog:
         with pytest.raises(KeyError):
             self.cat.row_index(name="invalid")
 
+    def test_row_index_alias(self):
+        table = self.cat.table
+        table["Alias"] = MaskedColumn([b"x, y ", b"z", b""], mask=[False, True, False])
+        cat = SomeSourceCatalog(table, source_name_alias=("Alias",))
+
+        assert cat.row_index(name="x") == 0
+        assert cat.row_index(name="y") == 0
+        assert "z" not in cat._name_to_index_cache
+
     def test_source_name(self):
         name = self.cat.source_name(index=1)
         assert name == "bb"
@@ -52,6 +61,21 @@ class TestSourceCatalog:
         with pytest.raises(IndexError):
             self.cat.source_name("invalid")
 
+    def test_lookup_additional_table(self):
+        column = Column([" a", "bb "])
+        lookup = self.cat._lookup_additional_table(column)
+        assert lookup == {"a": 0, "bb": 1}
+        assert self.cat._lookup_additional_table(column) is lookup
+
+    def test_time_axis(self):
+        hist_table = Table({"Hist_Start": Quantity([0, 10, 20], "s")})
+        hist_table.meta.update(MJDREFI=51910, MJDREFF="7.428703703703703D-4")
+        time_axis = self.cat._time_axis(hist_table)
+        assert time_axis.nbin == 2
+        assert self.cat._time_axis(hist_table) is time_axis
+
+        assert self.cat._time_axis(Table({"Hist_Start": [0.0, 1.0]})) is None
+
     def test_getitem(self):
         source = self.cat["a"]
         assert source.data["Source_Name"] == "a"
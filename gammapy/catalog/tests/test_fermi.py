@@ -13,6 +13,7 @@ from gammapy.catalog import (
     SourceCatalog3PC,
     SourceCatalog4FGL,
 )
+from gammapy.catalog.fermi import _read_auxiliary_file, _read_template_map
 from gammapy.modeling.models import (
     ExpCutoffPowerLaw3FGLSpectralModel,
     LogParabolaSpectralModel,
@@ -293,6 +294,32 @@ class TestFermi4FGLObject:
         assert model.frame == "fk5"
         assert model.normalize
 
+    def test_preload_templates(self):
+        _read_template_map.cache_clear()
+        self.cat.preload_templates(n_jobs=2)
+        assert _read_template_map.cache_info().currsize > 0
+
+        self.cat["4FGL J1443.0-6227e"].spatial_model()
+        assert _read_template_map.cache_info().misses == 0
+
+    def test_model_cache(self):
+        source = self.cat["4FGL J1409.1-6121e"]
+        model = source.spectral_model()
+        model.amplitude.value = 0
+        assert source.spectral_model() is not model
+        assert source.spectral_model().amplitude.value > 0
+
+        model = source.spatial_model()
+        assert_allclose(source.spatial_model().r_0.value, model.r_0.value)
+        assert_allclose(model.lon_0.error, source.spatial_model().lon_0.error)
+
+    def test_flux_points_table_cache(self):
+        source = self.cat["4FGL J1409.1-6121e"]
+        table = source.flux_points_table
+        table["flux"] = 0
+        assert source.flux_points_table is not table
+        assert source.flux_points_table["flux"][0] > 0
+
     @pytest.mark.parametrize("ref", SOURCES_4FGL, ids=lambda _: _["name"])
     def test_sky_model(self, ref):
         self.cat[ref["idx"]].sky_model
@@ -322,6 +349,17 @@ class TestFermi4FGLObject:
         assert_allclose(fp.n_sigma, 1)
         assert_allclose(fp.n_sigma_ul, 2)
 
+    def test_flux_points_reference_model(self):
+        source = self.cat["4FGL J1409.1-6121e"]
+        reference_model = source.flux_points.reference_model
+
+        assert reference_model.name == source.name
+        assert reference_model.spatial_model is None
+        assert_allclose(
+            reference_model.spectral_model.amplitude.value,
+            source.spectral_model().amplitude.value,
+        )
+
     def test_flux_points_ul(self):
         source = self.cat["4FGL J0000.3-7355"]
         flux_points = source.flux_points
@@ -337,6 +375,43 @@ class TestFermi4FGLObject:
         ]
         assert_allclose(flux_points.flux_ul.data.flat, desired, rtol=1e-5)
 
+    def test_flux_points_table_batch(self):
+        source = self.cat["4FGL J0000.3-7355"]
+        table = source.flux_points_table
+
+        source.data.pop("fp_columns")
+        expected = source.flux_points_table
+
+        assert table.colnames == expected.colnames
+        for name in table.colnames:
+            assert_allclose(table[name], expected[name])
+
+        subcat = self.cat[self.cat.table["GLAT"].quantity < -40 * u.deg]
+        table = subcat["4FGL J0000.3-7355"].flux_points_table
+        assert_allclose(table["flux_ul"], expected["flux_ul"])
+
+    def test_info_basic_batch(self):
+        source = self.cat["4FGL J1409.1-6121e"]
+        info = source.info("basic")
+
+        source.data.pop("info_basic")
+        assert info == source.info("basic")
+
+    def test_is_pointlike_batch(self):
+        assert self.cat["4FGL J1409.1-6121e"].data["is_pointlike"] is False
+        assert self.source.data["is_pointlike"] is True
+
+    def test_spec_type_batch(self):
+        spec_type = self.cat["4FGL J0000.3-7355"].data["spec_type"]
+        assert spec_type == "PowerLaw"
+        assert spec_type is self.cat["4FGL J0000.3-7355"]._spec_type
+
+    def test_eccentricity_batch(self):
+        de = self.cat["4FGL J1409.1-6121e"].data_extended
+        e = (1 - (de["Model_SemiMinor"] / de["Model_SemiMajor"]) ** 2.0) ** 0.5
+        assert_quantity_allclose(de["eccentricity"], e)
+        assert "eccentricity" not in self.cat.extended_sources_table.colnames
+
     def test_lightcurve_dr1(self):
         lc = self.source.lightcurve(interval="1-year")
         table = lc.to_table(format="lightcurve", sed_type="flux")
@@ -491,6 +566,22 @@ class TestFermi3FGLObject:
     def test_sky_model(self, ref):
         self.cat[ref["idx"]].sky_model()
 
+    def test_get_flux_values(self):
+        values = self.source._get_flux_values("Unc_Flux")
+        assert values.shape == (5, 2)
+        assert values.unit == "cm-2 s-1"
+        assert self.source._get_flux_values("Unc_Flux") is values
+
+    def test_spatial_model_template_cache(self):
+        _read_template_map.cache_clear()
+        model = self.cat[602].spatial_model()
+        other = self.cat[602].spatial_model()
+
+        assert _read_template_map.cache_info().misses == 1
+        assert _read_template_map.cache_info().hits == 1
+        assert model is not other
+        assert model.filename == other.filename
+
     def test_flux_points(self):
         flux_points = self.source.flux_points
 
@@ -507,6 +598,12 @@ class TestFermi3FGLObject:
         desired = [4.096391e-09, 6.680059e-10, np.nan, np.nan, np.nan]
         assert_allclose(flux_points.flux_ul.data.flat, desired, rtol=1e-5)
 
+    def test_sqrt_ts_batch(self):
+        data = self.source.data
+        desired = [data[f"Sqrt_TS{_}"] for _ in self.source._energy_edges_suffix]
+        assert_allclose(data["sqrt_ts"], desired)
+        assert_allclose(self.source.flux_points_table["sqrt_ts"], desired)
+
     def test_lightcurve(self):
         lc = self.source.lightcurve()
         table = lc.to_table(format="lightcurve", sed_type="flux")
@@ -864,6 +961,21 @@ class TestFermi3PCObject:
         model = self.cat[ref["idx"]].spectral_model()
         assert model is None
 
+    def test_spectral_model_cache(self):
+        source = self.cat[SOURCES_3PC[0]["idx"]]
+        source.spectral_model()
+        source.spectral_model("auto")
+        source.spectral_model(fit="auto")
+        assert len(source._model_cache) == 1
+
+    def test_spectral_model_bfree(self):
+        for ref in SOURCES_3PC:
+            source = self.cat[ref["idx"]]
+            if source.data_spectral is None:
+                continue
+            d = source.data_spectral
+            assert d["has_bfree"] == (not np.ma.is_masked(d["PLEC_IndexS_bfr"]))
+
     def test_spatial_model(self):
         model = self.source.spatial_model()
         assert "PointSpatialModel" in model.tag
@@ -922,8 +1034,21 @@ class TestFermi3PCObject:
     def test_best_fit(self, ref=SOURCES_3PC[1]):
         profile = self.cat[ref["idx"]].pulse_profile_best_fit
         assert isinstance(profile, RegionNDMap)
+        assert type(profile.data) is np.ndarray
         assert_allclose(profile.data[67], 69.34279, rtol=1e-4)
 
+    def test_auxiliary_table_cache(self, ref=SOURCES_3PC[1]):
+        _read_auxiliary_file.cache_clear()
+        source = self.cat[ref["idx"]]
+        profile = source.pulse_profile_best_fit
+        profile.data[67] = 0
+
+        other = source.pulse_profile_best_fit
+        source.pulse_profiles
+        assert _read_auxiliary_file.cache_info().misses == 1
+        assert _read_auxiliary_file.cache_info().hits == 2
+        assert_allclose(other.data[67], 69.34279, rtol=1e-4)
+
 
 @requires_data()
 class TestSourceCatalog3FGL:
@@ -1015,3 +1140,9 @@ class TestSourceCatalog3PC:
         subcat = self.cat[mask]
         models = subcat.to_models()
         assert len(models) == 17
+
+    def test_to_models_n_jobs(self):
+        mask = self.cat.table["Gb"] > 30
+        subcat = self.cat[mask]
+        models = subcat.to_models(n_jobs=2)
+        assert models.names == subcat.to_models().names
@@ -0,0 +1,159 @@
+# Licensed under a 3-clause BSD style license - see LICENSE.rst
+import pytest
+import numpy as np
+from numpy.testing import assert_allclose, assert_equal
+from gammapy.catalog._fermi_kernels import (
+    compute_fp_numpy,
+    compute_fp_sqrt_ts_numpy,
+    compute_lightcurve_numpy,
+    compute_ul_numpy,
+    get_fermi_kernels,
+    bin_edges_numpy,
+    unique_sorted_numpy,
+)
+from gammapy.utils.testing import requires_dependency
+
+
+@pytest.fixture()
+def flux_points_data():
+    flux = np.array([3.1e-9, 8.4e-10, 1.2e-11, 4e-12], dtype=">f4")
+    flux_err_lo = np.array([-2e-10, -5e-11, np.nan, np.nan], dtype=">f4")
+    flux_err_hi = np.array([2.1e-10, 5.2e-11, 6e-12, 3e-12], dtype=">f4")
+    e2dnde = np.array([1.1e-11, 9.2e-12, 2e-12, 1.3e-12], dtype=">f4")
+    return flux, flux_err_lo, flux_err_hi, e2dnde
+
+
+def test_compute_fp_numpy(flux_points_data):
+    flux_errn, e2dnde_errn, e2dnde_errp, is_ul, flux_ul, e2dnde_ul = compute_fp_numpy(
+        *flux_points_data
+    )
+
+    assert_equal(is_ul, [False, False, True, True])
+    assert_allclose(flux_errn[:2], [2e-10, 5e-11], rtol=1e-6)
+    assert_allclose(e2dnde_errn[0], 7.096774e-13, rtol=1e-6)
+    assert_allclose(e2dnde_errp[0], 7.451613e-13, rtol=1e-6)
+    assert_allclose(flux_ul, [np.nan, np.nan, 2.4e-11, 1e-11], rtol=1e-6)
+    assert_allclose(e2dnde_ul[2], 4e-12, rtol=1e-6)
+
+
+@requires_dependency("numba")
+def test_compute_fp_jit(flux_points_data):
+    actual = get_fermi_kernels("jit")["compute_fp"](*flux_points_data)
+    expected = get_fermi_kernels("cython")["compute_fp"](*flux_points_data)
+
+    for value, ref in zip(actual, expected):
+        assert value.dtype == ref.dtype
+        assert_allclose(value, ref, rtol=1e-6)
+
+
+def test_compute_fp_sqrt_ts_numpy(flux_points_data):
+    sqrt_ts = np.array([4.0, 1.5, 1.0, np.nan], dtype=">f4")
+    flux_errn, _, e2dnde_errp, is_ul, flux_ul, e2dnde_ul = compute_fp_sqrt_ts_numpy(
+        *flux_points_data, sqrt_ts
+    )
+
+    assert_equal(is_ul, [False, True, True, True])
+    assert_allclose(flux_errn[:2], [2e-10, 5e-11], rtol=1e-6)
+    assert_allclose(flux_ul, [np.nan, 9.44e-10, 2.4e-11, 1e-11], rtol=1e-6)
+    assert_allclose(e2dnde_ul[1], 9.2e-12 + 2 * e2dnde_errp[1], rtol=1e-6)
+
+
+@requires_dependency("numba")
+def test_compute_fp_sqrt_ts_jit(flux_points_data):
+    sqrt_ts = np.array([4.0, 1.5, 1.0, np.nan], dtype=">f4")
+    actual = get_fermi_kernels("jit")["compute_fp_sqrt_ts"](*flux_points_data, sqrt_ts)
+    expected = get_fermi_kernels("cython")["compute_fp_sqrt_ts"](
+        *flux_points_data, sqrt_ts
+    )
+
+    for value, ref in zip(actual, expected):
+        assert value.dtype == ref.dtype
+        assert_allclose(value, ref, rtol=1e-6)
+
+
+@pytest.fixture()
+def lightcurve_data(flux_points_data):
+    flux, flux_err_lo, flux_err_hi, _ = flux_points_data
+    sqrt_ts = np.array([4.0, 2.5, 1.0, 0.0], dtype=">f4")
+    return flux, flux_err_lo, flux_err_hi, sqrt_ts
+
+
+def test_compute_lightcurve_numpy(lightcurve_data):
+    flux_errn, flux_ul, ts = compute_lightcurve_numpy(*lightcurve_data)
+
+    assert_allclose(flux_errn, [2e-10, 5e-11, np.nan, np.nan], rtol=1e-6)
+    assert_allclose(flux_ul, [3.52e-9, 9.44e-10, 2.4e-11, 1e-11], rtol=1e-6)
+    assert_allclose(ts, [16, 6.25, 1, 0], rtol=1e-6)
+
+
+@requires_dependency("numba")
+def test_compute_lightcurve_jit(lightcurve_data):
+    actual = get_fermi_kernels("jit")["compute_lightcurve"](*lightcurve_data)
+    expected = get_fermi_kernels("cython")["compute_lightcurve"](*lightcurve_data)
+
+    for value, ref in zip(actual, expected):
+        assert value.dtype == ref.dtype
+        assert_allclose(value, ref, rtol=1e-6)
+
+
+def test_compute_ul_numpy(flux_points_data):
+    flux, _, flux_err_hi, _ = flux_points_data
+    flux_ul = compute_ul_numpy(flux, flux_err_hi)
+
+    assert_allclose(flux_ul, [3.52e-9, 9.44e-10, 2.4e-11, 1e-11], rtol=1e-6)
+
+
+@requires_dependency("numba")
+def test_compute_ul_jit(flux_points_data):
+    flux, _, flux_err_hi, _ = flux_points_data
+    actual = get_fermi_kernels("jit")["compute_ul"](flux, flux_err_hi)
+    expected = get_fermi_kernels("cython")["compute_ul"](flux, flux_err_hi)
+
+    assert actual.dtype == expected.dtype
+    assert_allclose(actual, expected, rtol=1e-6)
+
+
+UNIQUE_VALUES = [[0.0, 0.1, 0.1, 0.2, 0.3, 0.3], [0.3, 0.1, 0.2, 0.1], [0.5], []]
+
+
+@pytest.mark.parametrize("values", UNIQUE_VALUES)
+def test_unique_sorted_numpy(values):
+    unique, index = unique_sorted_numpy(np.array(values))
+    desired_unique, desired_index = np.unique(values, return_index=True)
+
+    assert_allclose(unique, desired_unique)
+    assert_equal(index, desired_index)
+
+
+@requires_dependency("numba")
+@pytest.mark.parametrize("values", UNIQUE_VALUES)
+def test_unique_sorted_jit(values):
+    values = np.array(values, dtype=">f8")
+    unique, index = get_fermi_kernels("jit")["unique_sorted"](values)
+    desired_unique, desired_index = np.unique(values, return_index=True)
+
+    assert_allclose(unique, desired_unique)
+    assert_equal(index, desired_index)
+
+
+BIN_BOUNDS = [
+    ([0.0, 0.25, 0.5, 0.75], [0.25, 0.5, 0.75, 1.0]),
+    ([0.0, 0.5, 0.25], [0.25, 0.75, 0.5]),
+    ([0.0, 0.5], [0.25, 0.75]),
+    ([], []),
+]
+
+
+@pytest.mark.parametrize("lower, upper", BIN_BOUNDS)
+def test_bin_edges_numpy(lower, upper):
+    edges = bin_edges_numpy(np.array(lower), np.array(upper))
+    assert_allclose(edges, np.unique(np.concatenate([lower, upper])))
+
+
+@requires_dependency("numba")
+@pytest.mark.parametrize("lower, upper", BIN_BOUNDS)
+def test_bin_edges_jit(lower, upper):
+    lower = np.array(lower, dtype=">f8")
+    upper = np.array(upper, dtype=">f8")
+    edges = get_fermi_kernels("jit")["bin_edges"](lower, upper)
+    assert_allclose(edges, np.unique(np.concatenate([lower, upper])))